@@ -0,0 +1,39 @@
+"""Add unique indexes to discussion_likes
+
+Revision ID: 9b1f4c2e7a31
+Revises: 3dde80897250
+Create Date: 2026-10-17 10:12:04.518203
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b1f4c2e7a31'
+down_revision: str | Sequence[str] | None = '3dde80897250'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 중복 좋아요가 있으면 가장 먼저 생성된 행만 남김
+    op.execute(sa.text("""
+        DELETE FROM discussion_likes a
+        USING discussion_likes b
+        WHERE a.id > b.id
+          AND a.user_id = b.user_id
+          AND a.discussion_id IS NOT DISTINCT FROM b.discussion_id
+          AND a.reply_id IS NOT DISTINCT FROM b.reply_id
+    """))
+    op.create_index('uq_discussion_likes_user_discussion', 'discussion_likes', ['user_id', 'discussion_id'], unique=True)
+    op.create_index('uq_discussion_likes_user_reply', 'discussion_likes', ['user_id', 'reply_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_discussion_likes_user_reply', table_name='discussion_likes')
+    op.drop_index('uq_discussion_likes_user_discussion', table_name='discussion_likes')
@@ -0,0 +1,45 @@
+"""Add generated bbox columns to lots and gis buildings
+
+Revision ID: a1f7e2d6b938
+Revises: f5e0b3c8a417
+Create Date: 2026-10-17 16:20:37.915482
+
+"""
+from collections.abc import Sequence
+
+import geoalchemy2
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1f7e2d6b938'
+down_revision: str | Sequence[str] | None = 'f5e0b3c8a417'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 지도 bbox 조회 대상 테이블
+TABLES = ["lots", "gis_building_integrated"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        # ST_Envelope(geometry)를 저장하는 generated 컬럼 (기존 행은 추가 시 계산됨)
+        op.add_column(
+            table,
+            sa.Column(
+                'bbox',
+                geoalchemy2.Geometry(geometry_type='GEOMETRY', srid=4326, spatial_index=False),
+                sa.Computed('ST_Envelope(geometry)', persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(f'idx_{table}_bbox', table, ['bbox'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f'idx_{table}_bbox', table_name=table, postgresql_using='gist')
+        op.drop_column(table, 'bbox')
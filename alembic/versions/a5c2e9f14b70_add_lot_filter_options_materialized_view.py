@@ -0,0 +1,44 @@
+"""Add lot filter options materialized view
+
+Revision ID: a5c2e9f14b70
+Revises: c4e8a1d93f57
+Create Date: 2026-10-17 14:05:23.418276
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c2e9f14b70'
+down_revision: str | Sequence[str] | None = 'c4e8a1d93f57'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 필지 필터 옵션(컬럼별 고유값)을 미리 계산해 두고 파이프라인 적재 후 갱신
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_lot_filter_options AS
+        SELECT 'jimok' AS field, jimok AS value FROM lots
+        WHERE jimok IS NOT NULL GROUP BY jimok
+        UNION ALL
+        SELECT 'ownership', ownership FROM lots
+        WHERE ownership IS NOT NULL GROUP BY ownership
+        UNION ALL
+        SELECT 'use_zone', use_zone FROM lots
+        WHERE use_zone IS NOT NULL GROUP BY use_zone
+        UNION ALL
+        SELECT 'land_use', land_use FROM lots
+        WHERE land_use IS NOT NULL GROUP BY land_use
+    """)
+    # REFRESH ... CONCURRENTLY 에 필요한 유니크 인덱스
+    op.execute(
+        "CREATE UNIQUE INDEX uq_mv_lot_filter_options ON mv_lot_filter_options (field, value)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_lot_filter_options")
@@ -0,0 +1,32 @@
+"""Add trigram indexes to reports
+
+Revision ID: b8f1d6a3c295
+Revises: a5c2e9f14b70
+Create Date: 2026-10-17 15:12:08.731940
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f1d6a3c295'
+down_revision: str | Sequence[str] | None = 'a5c2e9f14b70'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 제목/부제/요약 ILIKE '%검색어%' 검색용 trigram 인덱스 (OR 조건은 BitmapOr로 결합)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_reports_title_trgm', 'reports', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_reports_subtitle_trgm', 'reports', ['subtitle'], unique=False, postgresql_using='gin', postgresql_ops={'subtitle': 'gin_trgm_ops'})
+    op.create_index('ix_reports_summary_trgm', 'reports', ['summary'], unique=False, postgresql_using='gin', postgresql_ops={'summary': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reports_summary_trgm', table_name='reports', postgresql_using='gin')
+    op.drop_index('ix_reports_subtitle_trgm', table_name='reports', postgresql_using='gin')
+    op.drop_index('ix_reports_title_trgm', table_name='reports', postgresql_using='gin')
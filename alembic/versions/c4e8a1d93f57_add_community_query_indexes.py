@@ -0,0 +1,44 @@
+"""Add indexes for community list queries
+
+Revision ID: c4e8a1d93f57
+Revises: 9b1f4c2e7a31
+Create Date: 2026-10-17 11:03:27.104592
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1d93f57'
+down_revision: str | Sequence[str] | None = '9b1f4c2e7a31'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 알림 목록 (user_id 필터 + created_at 정렬), 안 읽은 알림 조회/일괄 읽음 처리
+    op.create_index('ix_notifications_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False)
+    op.create_index('ix_notifications_user_id_unread', 'notifications', ['user_id', 'created_at'], unique=False, postgresql_where=sa.text('is_read = false'))
+
+    # 토론 목록 (동네 필터 + 최신순, 인기순)
+    op.create_index('ix_discussions_neighborhood_id_created_at', 'discussions', ['neighborhood_id', 'created_at'], unique=False)
+    op.create_index('ix_discussions_like_count', 'discussions', ['like_count'], unique=False)
+
+    # 제목/내용 ILIKE '%검색어%' 검색용 trigram 인덱스
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_discussions_title_trgm', 'discussions', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_discussions_content_trgm', 'discussions', ['content'], unique=False, postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_discussions_content_trgm', table_name='discussions', postgresql_using='gin')
+    op.drop_index('ix_discussions_title_trgm', table_name='discussions', postgresql_using='gin')
+    op.drop_index('ix_discussions_like_count', table_name='discussions')
+    op.drop_index('ix_discussions_neighborhood_id_created_at', table_name='discussions')
+    op.drop_index('ix_notifications_user_id_unread', table_name='notifications', postgresql_where=sa.text('is_read = false'))
+    op.drop_index('ix_notifications_user_id_created_at', table_name='notifications')
@@ -0,0 +1,38 @@
+"""Extend transaction date indexes with id for keyset pagination
+
+Revision ID: c6d3f8a2e517
+Revises: a1f7e2d6b938
+Create Date: 2026-10-17 17:05:41.318257
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6d3f8a2e517'
+down_revision: str | Sequence[str] | None = 'a1f7e2d6b938'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (테이블, 인덱스 접두어)
+TABLES = [
+    ('real_estate_sales', 'ix_sales'),
+    ('real_estate_rentals', 'ix_rentals'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (sgg_code, transaction_date) → (sgg_code, transaction_date, id)
+    # (계약일, id) keyset 페이지를 인덱스 범위 스캔만으로 처리
+    for table, prefix in TABLES:
+        op.create_index(f'{prefix}_sgg_txdate_id', table, ['sgg_code', 'transaction_date', 'id'], unique=False)
+        op.drop_index(f'{prefix}_sgg_txdate', table_name=table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, prefix in TABLES:
+        op.create_index(f'{prefix}_sgg_txdate', table, ['sgg_code', 'transaction_date'], unique=False)
+        op.drop_index(f'{prefix}_sgg_txdate_id', table_name=table)
@@ -0,0 +1,27 @@
+"""Add users (created_at, id) index for keyset pagination
+
+Revision ID: e9b4a7c1d352
+Revises: c6d3f8a2e517
+Create Date: 2026-10-17 17:48:12.905634
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9b4a7c1d352'
+down_revision: str | Sequence[str] | None = 'c6d3f8a2e517'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 관리자 사용자 목록 최신순 keyset 페이지네이션 (created_at, id)
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_id', table_name='users')
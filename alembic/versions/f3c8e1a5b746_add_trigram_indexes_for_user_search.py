@@ -0,0 +1,30 @@
+"""Add trigram indexes for user search
+
+Revision ID: f3c8e1a5b746
+Revises: e9b4a7c1d352
+Create Date: 2026-10-17 18:31:07.284519
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c8e1a5b746'
+down_revision: str | Sequence[str] | None = 'e9b4a7c1d352'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 관리자 사용자 검색 이름/이메일 ILIKE '%검색어%'용 trigram 인덱스 (OR 조건은 BitmapOr로 결합)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_users_name_trgm', 'users', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_users_email_trgm', 'users', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_users_name_trgm', table_name='users', postgresql_using='gin')
@@ -0,0 +1,29 @@
+"""Add partial index for published reports
+
+Revision ID: f5e0b3c8a417
+Revises: b8f1d6a3c295
+Create Date: 2026-10-17 15:52:19.648201
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5e0b3c8a417'
+down_revision: str | Sequence[str] | None = 'b8f1d6a3c295'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 발행된 리포트 목록 (status = 'published' + published_at 최신순)
+    op.create_index('ix_reports_published_at_published', 'reports', [sa.text('published_at DESC')], unique=False, postgresql_where=sa.text("status = 'published'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reports_published_at_published', table_name='reports', postgresql_where=sa.text("status = 'published'"))
@@ -1,13 +1,13 @@
 """건축물 엔드포인트 - 종합 조회."""
 
-import asyncio
 import re
+from collections.abc import AsyncIterator
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from app.crud import public_data as crud
-from app.database import get_db
+from app.database import async_session_maker
 from app.schemas.public_data import (
     AreaInfo,
     BuildingDetailResponse,
@@ -22,30 +22,30 @@ router = APIRouter()
 PNU_PATTERN = re.compile(r"^\d{19}$")
 
 
+def _validate_pnu(pnu: str) -> None:
+    if not PNU_PATTERN.match(pnu):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="PNU는 19자리 숫자여야 합니다.",
+        )
+
+
 @router.get(
     "/{pnu}",
     response_model=BuildingDetailResponse,
     summary="건축물 종합 조회",
     description="PNU로 건축물의 총괄표제부, 표제부, 층별개요, 면적, GIS 건물정보를 종합 조회합니다.",
 )
-async def get_building_detail(
-    pnu: str,
-    db: AsyncSession = Depends(get_db),
-) -> BuildingDetailResponse:
-    if not PNU_PATTERN.match(pnu):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="PNU는 19자리 숫자여야 합니다.",
-        )
+async def get_building_detail(pnu: str) -> BuildingDetailResponse:
+    _validate_pnu(pnu)
 
     # 모든 건축물 데이터를 병렬 조회
-    general, headers, gis_buildings, floor_details, areas = await asyncio.gather(
-        crud.get_building_general(db, pnu),
-        crud.get_building_headers(db, pnu),
-        crud.get_gis_buildings(db, pnu),
-        crud.get_building_floor_details(db, pnu),
-        crud.get_building_areas(db, pnu),
-    )
+    bundle = await crud.get_building_bundle(pnu)
+    general = bundle["general"]
+    headers = bundle["headers"]
+    gis_buildings = bundle["gis_buildings"]
+    floor_details = bundle["floor_details"]
+    areas = bundle["areas"]
 
     if not general and not headers and not gis_buildings:
         raise HTTPException(
@@ -61,3 +61,38 @@ async def get_building_detail(
         areas=[AreaInfo.model_validate(a) for a in areas],
         gis_buildings=[GisBuildingInfo.model_validate(g) for g in gis_buildings],
     )
+
+
+@router.get(
+    "/{pnu}/floor-details/stream",
+    response_class=StreamingResponse,
+    summary="층별개요 스트리밍 조회",
+    description="PNU의 층별개요 전체를 줄 단위 JSON(NDJSON)으로 스트리밍합니다.",
+)
+async def stream_floor_details(pnu: str) -> StreamingResponse:
+    _validate_pnu(pnu)
+
+    async def ndjson() -> AsyncIterator[str]:
+        # 응답 본문을 보내는 동안 쓰는 세션이므로 get_db가 아닌 제너레이터가 직접 열고 닫음
+        async with async_session_maker() as db:
+            async for floor in crud.iter_building_floor_details(db, pnu):
+                yield FloorDetailInfo.model_validate(floor).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get(
+    "/{pnu}/areas/stream",
+    response_class=StreamingResponse,
+    summary="전유공용면적 스트리밍 조회",
+    description="PNU의 전유공용면적 전체를 줄 단위 JSON(NDJSON)으로 스트리밍합니다.",
+)
+async def stream_areas(pnu: str) -> StreamingResponse:
+    _validate_pnu(pnu)
+
+    async def ndjson() -> AsyncIterator[str]:
+        async with async_session_maker() as db:
+            async for area in crud.iter_building_areas(db, pnu):
+                yield AreaInfo.model_validate(area).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
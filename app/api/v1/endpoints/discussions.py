@@ -1,13 +1,17 @@
 """Discussion endpoints."""
 
+import asyncio
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.deps import CurrentUser, CurrentUserOptional
 from app.crud.discussion import discussion as discussion_crud
 from app.crud.discussion import discussion_like as like_crud
 from app.crud.discussion import discussion_reply as reply_crud
-from app.database import get_db
+from app.database import async_session_maker, get_db, run_in_session
 from app.schemas.base import PaginatedResponse, PaginationMeta
 from app.schemas.discussion import (
     DiscussionCreate,
@@ -59,23 +63,24 @@ async def get_discussion(
     db: AsyncSession = Depends(get_db),
 ) -> DiscussionWithDetails:
     """Get a discussion by ID."""
-    discussion = await discussion_crud.get(db, discussion_id)
+    # Increment view count and load the discussion together; the like check is
+    # independent, so it runs concurrently on its own session
+    is_liked = False
+    if current_user:
+        discussion, is_liked = await asyncio.gather(
+            discussion_crud.get_and_increment_view_count(db, id=discussion_id),
+            run_in_session(
+                like_crud.is_liked, user_id=current_user.id, discussion_id=discussion_id
+            ),
+        )
+    else:
+        discussion = await discussion_crud.get_and_increment_view_count(db, id=discussion_id)
     if not discussion:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다",
         )
 
-    # Increment view count
-    await discussion_crud.increment_view_count(db, db_obj=discussion)
-
-    # Check if user liked
-    is_liked = False
-    if current_user:
-        is_liked = await like_crud.is_liked(
-            db, user_id=current_user.id, discussion_id=discussion_id
-        )
-
     response = DiscussionWithDetails.model_validate(discussion)
     response.is_liked = is_liked
     return response
@@ -202,6 +207,25 @@ async def list_replies(
     return [DiscussionReplyResponse.model_validate(r) for r in replies]
 
 
+@router.get(
+    "/{discussion_id}/replies/stream",
+    response_class=StreamingResponse,
+    summary="Stream replies",
+    description="Stream all replies for a discussion as newline-delimited JSON",
+)
+async def stream_replies(discussion_id: int) -> StreamingResponse:
+    """Stream all replies for a discussion without loading them at once."""
+
+    async def ndjson() -> AsyncIterator[str]:
+        # The generator outlives the endpoint, so it owns its session rather than
+        # borrowing get_db's, which may already be closed by the time it runs
+        async with async_session_maker() as db:
+            async for reply in reply_crud.iter_by_discussion(db, discussion_id=discussion_id):
+                yield DiscussionReplyResponse.model_validate(reply).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/{discussion_id}/replies",
     response_model=DiscussionReplyResponse,
@@ -261,6 +285,11 @@ async def update_reply(
         )
 
     reply = await reply_crud.update_reply(db, db_obj=reply, content=reply_in.content)
+    if not reply:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="댓글을 찾을 수 없습니다",
+        )
     return DiscussionReplyResponse.model_validate(reply)
 
 
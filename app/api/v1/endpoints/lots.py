@@ -20,6 +20,7 @@ from app.schemas.public_data import (
 router = APIRouter()
 
 PNU_PATTERN = re.compile(r"^\d{19}$")
+SGG_CODE_PATTERN = re.compile(r"^\d{5}$")
 
 
 def _validate_pnu(pnu: str) -> None:
@@ -37,10 +38,8 @@ def _validate_pnu(pnu: str) -> None:
     summary="필지 필터 옵션 조회",
     description="필터에 사용할 지목, 소유구분, 용도지역, 이용현황의 고유값 목록을 반환합니다.",
 )
-async def get_lot_filter_options(
-    db: AsyncSession = Depends(get_db),
-) -> LotFilterOptions:
-    options = await crud.get_lot_filter_options(db)
+async def get_lot_filter_options() -> LotFilterOptions:
+    options = await crud.get_lot_filter_options()
     return LotFilterOptions(**options)
 
 
@@ -57,6 +56,9 @@ async def search_lots(
     sgg_code: str | None = Query(None, description="시군구코드 (5자리)"),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    estimate_total: bool = Query(
+        False, description="true면 total을 정확한 COUNT 대신 플래너 추정치로 반환 (시군구 검색)"
+    ),
 ) -> PaginatedResponse[LotSearchResult] | list[LotSearchResult]:
     # 좌표 검색
     if lat is not None and lng is not None:
@@ -67,9 +69,14 @@ async def search_lots(
 
     # 시군구코드 검색 (페이지네이션)
     if sgg_code:
+        if not SGG_CODE_PATTERN.match(sgg_code):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="시군구코드는 5자리 숫자여야 합니다.",
+            )
         offset = (page - 1) * limit
         lots, total = await crud.search_lots_by_sgg(
-            db, sgg_code, offset=offset, limit=limit
+            db, sgg_code, offset=offset, limit=limit, exact_count=not estimate_total
         )
         return PaginatedResponse(
             data=[LotSearchResult.model_validate(lot) for lot in lots],
@@ -103,13 +103,14 @@ async def get_map_lots(
         return MapResponse(features=[], total=0)
 
     _validate_bbox(min_lng, min_lat, max_lng, max_lat)
-    lots = await crud.get_lots_in_bbox(
+    # 행이 도착하는 대로 Feature로 변환해 조회 결과를 오래 들고 있지 않음
+    lots = crud.iter_lots_in_bbox(
         db, min_lng, min_lat, max_lng, max_lat, limit=limit,
         jimok=jimok, min_area=min_area, max_area=max_area,
         ownership=ownership, land_use=land_use, use_zone=use_zone,
         min_official_price=min_official_price, max_official_price=max_official_price,
     )
-    features = [_lot_to_feature(lot) for lot in lots]
+    features = [_lot_to_feature(lot) async for lot in lots]
     return MapResponse(features=features, total=len(features))
 
 
@@ -128,8 +129,8 @@ async def get_map_buildings(
     db: AsyncSession = Depends(get_db),
 ) -> MapResponse:
     _validate_bbox(min_lng, min_lat, max_lng, max_lat)
-    buildings = await crud.get_buildings_in_bbox(
+    buildings = crud.iter_buildings_in_bbox(
         db, min_lng, min_lat, max_lng, max_lat, limit=limit
     )
-    features = [_building_to_feature(bldg) for bldg in buildings]
+    features = [_building_to_feature(bldg) async for bldg in buildings]
     return MapResponse(features=features, total=len(features))
@@ -137,6 +137,11 @@ async def mark_as_read(
         )
 
     notification = await notification_crud.mark_as_read(db, db_obj=notification)
+    if not notification:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="알림을 찾을 수 없습니다",
+        )
     return NotificationResponse.model_validate(notification)
 
 
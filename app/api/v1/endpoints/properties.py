@@ -1,12 +1,13 @@
 """통합 요약 엔드포인트 - AI 콘텐츠 생성용."""
 
+import asyncio
 import re
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud import public_data as crud
-from app.database import get_db
+from app.database import get_db, run_in_session
 from app.schemas.public_data import (
     AncillaryLotItem,
     BuildingSummary,
@@ -39,21 +40,23 @@ async def get_property_summary(
             detail="PNU는 19자리 숫자여야 합니다.",
         )
 
-    lot = await crud.get_lot_by_pnu(db, pnu)
+    # PNU에서 sgg_code 추출 (앞 5자리)
+    sgg_code = pnu[:5]
+
+    # 필지 조회도 함께 병렬 실행 (요청 세션은 필지 조회에서만 사용)
+    lot, general, headers, recent_sales, recent_rentals = await asyncio.gather(
+        crud.get_lot_by_pnu(db, pnu),
+        run_in_session(crud.get_building_general, pnu),
+        run_in_session(crud.get_building_headers, pnu),
+        run_in_session(crud.get_recent_sales_by_sgg, sgg_code, limit=5),
+        run_in_session(crud.get_recent_rentals_by_sgg, sgg_code, limit=5),
+    )
     if not lot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="필지를 찾을 수 없습니다.",
         )
 
-    # PNU에서 sgg_code 추출 (앞 5자리)
-    sgg_code = pnu[:5]
-
-    general = await crud.get_building_general(db, pnu)
-    headers = await crud.get_building_headers(db, pnu)
-    recent_sales = await crud.get_recent_sales_by_sgg(db, sgg_code, limit=5)
-    recent_rentals = await crud.get_recent_rentals_by_sgg(db, sgg_code, limit=5)
-
     building_summary = None
     if general:
         building_summary = BuildingSummary(
@@ -36,8 +36,7 @@ async def list_categories(
     db: AsyncSession = Depends(get_db),
 ) -> list[ReportCategoryResponse]:
     """List all report categories."""
-    categories = await category_crud.get_all(db)
-    return [ReportCategoryResponse.model_validate(c) for c in categories]
+    return await category_crud.get_all(db)
 
 
 @router.post(
@@ -177,6 +176,11 @@ async def update_report(
         )
 
     report = await report_crud.update_report(db, db_obj=report, obj_in=report_in)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="리포트를 찾을 수 없습니다",
+        )
     return ReportResponse.model_validate(report)
 
 
@@ -200,6 +204,11 @@ async def publish_report(
         )
 
     report = await report_crud.publish(db, db_obj=report)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="리포트를 찾을 수 없습니다",
+        )
     return ReportResponse.model_validate(report)
 
 
@@ -223,6 +232,11 @@ async def archive_report(
         )
 
     report = await report_crud.archive(db, db_obj=report)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="리포트를 찾을 수 없습니다",
+        )
     return ReportResponse.model_validate(report)
 
 
@@ -1,12 +1,12 @@
 """실거래가 엔드포인트 - 매매/전월세 조회."""
 
+import asyncio
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, Query, status
 
 from app.crud import public_data as crud
-from app.database import get_db
+from app.database import run_in_session
 from app.models.enums import PropertyType, TransactionType
 from app.schemas.public_data import (
     RentalResponse,
@@ -33,7 +33,6 @@ async def get_transactions(
     ),
     from_date: date | None = Query(None, description="시작일 (YYYY-MM-DD)"),
     to_date: date | None = Query(None, description="종료일 (YYYY-MM-DD)"),
-    db: AsyncSession = Depends(get_db),
 ) -> TransactionListResponse:
     # 날짜 범위 검증
     if from_date and to_date and from_date > to_date:
@@ -42,24 +41,25 @@ async def get_transactions(
             detail="시작일(from_date)은 종료일(to_date)보다 이전이어야 합니다.",
         )
 
-    sales, _ = await crud.get_sales(
-        db,
-        sgg_code,
-        property_type=property_type,
-        from_date=from_date,
-        to_date=to_date,
-        offset=0,
-        limit=MAX_ITEMS,
-    )
-    rentals, _ = await crud.get_rentals(
-        db,
-        sgg_code,
-        property_type=property_type,
-        transaction_type=transaction_type,
-        from_date=from_date,
-        to_date=to_date,
-        offset=0,
-        limit=MAX_ITEMS,
+    # 매매/전월세 조회는 서로 독립적이므로 각자 세션에서 동시에 실행
+    (sales, _), (rentals, _) = await asyncio.gather(
+        run_in_session(
+            crud.get_sales,
+            sgg_code,
+            property_type=property_type,
+            from_date=from_date,
+            to_date=to_date,
+            limit=MAX_ITEMS,
+        ),
+        run_in_session(
+            crud.get_rentals,
+            sgg_code,
+            property_type=property_type,
+            transaction_type=transaction_type,
+            from_date=from_date,
+            to_date=to_date,
+            limit=MAX_ITEMS,
+        ),
     )
 
     return TransactionListResponse(
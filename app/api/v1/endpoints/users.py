@@ -45,8 +45,27 @@ async def list_users(
     admin: AdminUser = None,
     db: AsyncSession = Depends(get_db),
 ) -> PaginatedResponse[UserResponse]:
-    """List users with filtering and pagination."""
-    users, total = await user_crud.get_multi_with_query(db, query=query)
+    """List users with filtering and pagination.
+
+    For the default newest-first order, pass ``pagination.next_cursor`` back as
+    ``cursor`` to fetch the following page without an OFFSET scan.
+    """
+    if query.cursor and query.sort_by != "newest":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor는 최신순(newest) 정렬에서만 사용할 수 있습니다",
+        )
+    try:
+        users, total = await user_crud.get_multi_with_query(db, query=query)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor입니다",
+        ) from None
+
+    next_cursor = None
+    if query.sort_by == "newest" and len(users) == query.limit:
+        next_cursor = user_crud.encode_cursor(users[-1])
 
     return PaginatedResponse(
         data=[UserResponse.model_validate(u) for u in users],
@@ -55,6 +74,7 @@ async def list_users(
             limit=query.limit,
             total=total,
             total_pages=(total + query.limit - 1) // query.limit,
+            next_cursor=next_cursor,
         ),
     )
 
@@ -149,6 +169,11 @@ async def update_user_role(
         )
 
     user = await user_crud.update_role(db, db_obj=user, role=role_in.role.value)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다",
+        )
     return UserResponse.model_validate(user)
 
 
@@ -172,6 +197,11 @@ async def deactivate_user(
         )
 
     user = await user_crud.deactivate(db, db_obj=user)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다",
+        )
     return UserResponse.model_validate(user)
 
 
@@ -195,6 +225,11 @@ async def activate_user(
         )
 
     user = await user_crud.activate(db, db_obj=user)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다",
+        )
     return UserResponse.model_validate(user)
 
 
@@ -19,7 +19,7 @@ async def get_current_user_optional(
     if not user_id:
         return None
 
-    user = await user_crud.get(db, user_id)
+    user = await user_crud.get_cached(db, user_id)
     if not user or not user.is_active:
         # Clear invalid session
         request.session.clear()
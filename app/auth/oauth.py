@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import settings
 from app.crud.user import user as user_crud
 from app.database import get_db
+from app.models.base import sql_utc_now
 from app.models.user import AuthProvider, User, UserRole
 
 oauth_router = APIRouter(prefix="/auth", tags=["auth"])
@@ -299,10 +300,17 @@ async def _create_or_update_user(
     user = await user_crud.get(db, user_id)
 
     if user:
-        # Update existing user
-        user.name = name
-        user.profile_image_url = profile_image_url
-        await user_crud.update_last_login(db, db_obj=user)
+        # Update existing user (profile and last login in one UPDATE ... RETURNING,
+        # which refreshes the loaded instance)
+        await user_crud.update_by_id(
+            db,
+            id=user.id,
+            values={
+                "name": name,
+                "profile_image_url": profile_image_url,
+                "last_login_at": sql_utc_now(),
+            },
+        )
     else:
         # Check if email already exists (different provider)
         existing = await user_crud.get_by_email(db, email)
@@ -312,17 +320,17 @@ async def _create_or_update_user(
             await user_crud.update_last_login(db, db_obj=user)
         else:
             # Create new user
-            user = User(
-                id=user_id,
-                email=email,
-                name=name,
-                profile_image_url=profile_image_url,
-                provider=provider.value,
-                role=UserRole.USER.value,
-                is_active=True,
+            user = await user_crud.create(
+                db,
+                obj_in={
+                    "id": user_id,
+                    "email": email,
+                    "name": name,
+                    "profile_image_url": profile_image_url,
+                    "provider": provider.value,
+                    "role": UserRole.USER.value,
+                    "is_active": True,
+                },
             )
-            db.add(user)
-            await db.flush()
-            await db.refresh(user)
 
     return user
@@ -1,4 +1,20 @@
-from .agent import RegionalPolicyAgent
-from .supervisor import SupervisorAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agent import RegionalPolicyAgent
+    from .supervisor import SupervisorAgent
 
 __all__ = ["RegionalPolicyAgent", "SupervisorAgent"]
+
+
+def __getattr__(name: str):
+    # 서브모듈(models, tools 등)만 쓰는 경우 LangGraph 체인을 로드하지 않도록 지연 import
+    if name == "RegionalPolicyAgent":
+        from .agent import RegionalPolicyAgent
+
+        return RegionalPolicyAgent
+    if name == "SupervisorAgent":
+        from .supervisor import SupervisorAgent
+
+        return SupervisorAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,11 @@
 
 import asyncio
 import json
+import logging
 import os
 import sys
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 # 현재 디렉토리를 path에 추가하여 모듈 import 가능하게 함
 # app/core/agent/main.py 위치 기준, 프로젝트 루트는 ../../../
@@ -14,12 +16,14 @@ sys.path.append(
     )
 )
 
-from app.core.agent.agent import RegionalPolicyAgent
-from app.core.agent.models import AddressInput, DevelopmentEventAnalysis, SupervisorState
+from app.core.agent.models import AddressInput, DevelopmentEventAnalysis
 from InquirerPy import inquirer
 
+if TYPE_CHECKING:
+    from app.core.agent.agent import RegionalPolicyAgent
 
-async def run_analysis_only(agent: RegionalPolicyAgent, region: str):
+
+async def run_analysis_only(agent: "RegionalPolicyAgent", region: str):
     """호재/악재 분석 전용 모드 실행."""
     print(f"\n[시스템] '{region}' 호재/악재 분석을 시작합니다...")
 
@@ -102,6 +106,9 @@ async def main():
     print("=" * 60)
 
     try:
+        # LangGraph/LLM 클라이언트 체인은 실제 실행 시에만 로드
+        from app.core.agent.agent import RegionalPolicyAgent
+
         agent = RegionalPolicyAgent(llm_provider="openai", interactive=True)
     except Exception as e:
         print(f"[오류] 에이전트 초기화 실패: {e}")
@@ -151,28 +158,18 @@ async def main():
                     elif choice == '2':
                         print(f"\n[시스템] '{region}' 블로그 콘텐츠 생성을 시작합니다...")
 
-                        # Supervisor 초기 상태 수동 구성
+                        # Supervisor 초기 상태 구성 (분석 결과 재사용)
                         supervisor = agent.agent
-                        initial_state: SupervisorState = {
-                            "user_query": region,
-                            "admin_region": supervisor._extract_region_from_query(region),
-                            "intent_analysis": None,
-                            "collection_retries": 0,
-                            "raw_articles": articles,  # 수집된 기사 재사용
-                            "classified_articles": [], # analyzer가 반환했지만 내부 로직용이라 비워둠(필요시 채움)
-                            "policy_issues": issues,   # 추출된 이슈 재사용
-                            "development_analysis": analysis, # 분석 결과 재사용
-                            "final_content": None,
-                            "seo_score": None,
-                            "next_action": "",
-                            "retry_count": 0,
-                            "steps_log": [],
-                            "error": None,
-                            "post_url": None,
-                        }
+                        initial_state = supervisor.build_initial_state(
+                            region,
+                            admin_region=supervisor._extract_region_from_query(region),
+                            raw_articles=articles,  # 수집된 기사 재사용
+                            policy_issues=issues,   # 추출된 이슈 재사용
+                            development_analysis=analysis, # 분석 결과 재사용
+                        )
 
                         # 그래프 실행 (GENERATE_CONTENT 단계부터 시작되도록 유도됨)
-                        result = await supervisor.graph.ainvoke(initial_state)
+                        result = await supervisor.invoke(initial_state)
 
                         # 결과 출력 (기존 로직 활용)
                         if result.get("final_content"):
@@ -218,4 +215,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    # 티스토리 발행기 등 logger 기반 진행 로그를 stdout으로 출력
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
     asyncio.run(main())
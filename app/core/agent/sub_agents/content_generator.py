@@ -8,13 +8,21 @@ Tistory ContentGenerator의 기능을 통합:
 - LLM 해시태그 생성
 """
 
+import asyncio
+import atexit
+import hashlib
+import heapq
+import json
 import os
 import re
 import uuid
+from collections import OrderedDict
+from collections.abc import Coroutine
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from openai import OpenAI
@@ -38,6 +46,97 @@ from app.core.agent.resources.region_prompts import (
 )
 
 
+# 동네핏 블로그 카테고리 체계
+BLOG_CATEGORIES = (
+    "동네 소식",
+    "동네 문화",
+    "동네 분석",
+    "동네 임장",
+    "주택 임장",
+    "상가 임장",
+    "부동산학개론",
+    "부동산 금융",
+    "부동산 개발",
+    "부동산 관리",
+    "부동산 법률 및 제도",
+    "부동산 정책 및 이슈",
+    "기타",
+)
+
+
+@lru_cache
+def _get_openai_client(api_key: str) -> OpenAI:
+    """API 키별 OpenAI 클라이언트를 공유 (커넥션 풀 재사용)."""
+    return OpenAI(api_key=api_key)
+
+
+async def _resolved[T](value: T) -> T:
+    """이미 확정된 값을 asyncio.gather에 넘기기 위한 코루틴."""
+    return value
+
+
+_sync_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run_sync[T](coro: Coroutine[Any, Any, T]) -> T:
+    """동기 래퍼용 이벤트 루프를 재사용하여 코루틴을 실행합니다.
+
+    asyncio.run()은 호출마다 루프를 새로 만들고 닫아 LLM 클라이언트의
+    커넥션 풀이 매번 버려지므로, 하나의 루프를 계속 사용합니다.
+    """
+    global _sync_loop
+    if _sync_loop is None or _sync_loop.is_closed():
+        _sync_loop = asyncio.new_event_loop()
+        atexit.register(_close_sync_loop, _sync_loop)
+    return _sync_loop.run_until_complete(coro)
+
+
+def _close_sync_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """프로세스 종료 시 동기 래퍼용 루프의 비동기 제너레이터/실행기를 정리하고 닫습니다."""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
+
+
+def _digest(*parts: str) -> str:
+    """캐시 키용 blake2b 다이제스트."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _lookup_region_data(region: str) -> Optional[Dict]:
+    """지역명으로 프롬프트 데이터를 찾습니다 (지역별 1회만 탐색)."""
+
+    # 1. 서울 자치구 검색
+    for gu_name, data in SEOUL_GU_PROMPTS.items():
+        # 정확히 일치하거나, 입력 문자열에 키가 포함된 경우 (예: "서울 강남구" -> "강남구")
+        if gu_name == region or gu_name in region:
+            return data
+
+    # '구'가 빠진 경우 (예: "강남" -> "강남구")
+    if region + "구" in SEOUL_GU_PROMPTS:
+        return SEOUL_GU_PROMPTS[region + "구"]
+
+    # 2. 경기 주요 도시 검색
+    for city_name, data in GYEONGGI_CITY_PROMPTS.items():
+        if city_name == region or city_name in region:
+            return data
+
+    # '시'가 빠진 경우 (예: "수원" -> "수원시")
+    if region + "시" in GYEONGGI_CITY_PROMPTS:
+        return GYEONGGI_CITY_PROMPTS[region + "시"]
+
+    return None
+
+
 class ContentGenerator:
     """블로그 콘텐츠 생성기.
 
@@ -48,6 +147,7 @@ class ContentGenerator:
     """
 
     ENABLE_IMAGE_GENERATION = False  # 이미지 생성 활성화 여부
+    RESULT_CACHE_SIZE = 256  # 동일 입력 재실행 시 재사용할 결과 수
 
     def __init__(self, llm_provider: str = "openai"):
         """Initialize content generator.
@@ -69,8 +169,23 @@ class ContentGenerator:
             )
 
         # DALL-E용 OpenAI 클라이언트
-        self.openai_client = OpenAI(api_key=settings.openai_api_key)
+        self.openai_client = _get_openai_client(settings.openai_api_key)
         self.image_style = "realistic photo, high quality, professional photography, 8k"
+        self._result_cache: OrderedDict[str, object] = OrderedDict()
+
+    def _cache_get(self, key: str):
+        """캐시된 결과 조회 (LRU 갱신)."""
+        if key not in self._result_cache:
+            return None
+        self._result_cache.move_to_end(key)
+        return self._result_cache[key]
+
+    def _cache_set(self, key: str, value: object) -> None:
+        """결과 캐싱 (최대 RESULT_CACHE_SIZE개 유지)."""
+        self._result_cache[key] = value
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
 
     # ========================================================
     # Main Public Methods
@@ -114,42 +229,39 @@ class ContentGenerator:
         # 지역 데이터 조회
         region_data = self._get_region_data(region)
 
-        # 블로그 본문 생성
-        blog_content = await self._generate_blog_content(
-            region,
-            policy_issues,
-            positive_issues,
-            negative_issues,
-            user_query,
-            needs_classification,
-            region_data,
+        # 블로그 본문 / 제목 / 메타 설명 생성 (제목과 메타 설명은 본문과 무관하므로 병렬)
+        if custom_title:
+            title_task = _resolved(custom_title)
+        else:
+            title_task = self._generate_title(
+                region, policy_issues, user_query, needs_classification
+            )
+
+        blog_content, blog_title, meta_description = await asyncio.gather(
+            self._generate_blog_content(
+                region,
+                policy_issues,
+                positive_issues,
+                negative_issues,
+                user_query,
+                needs_classification,
+                region_data,
+            ),
+            title_task,
+            self._generate_meta_description(region, policy_issues, user_query),
         )
 
         # DALL-E 이미지 생성 및 삽입
         image_paths = []
         if num_images > 0 and self.ENABLE_IMAGE_GENERATION:
             print(f"[시스템] {num_images}개의 이미지 생성 및 삽입 중...")
-            blog_content, image_paths = self._insert_images(
+            blog_content, image_paths = await self._insert_images(
                 blog_content, region, num_images
             )
             print(f"[시스템] {len(image_paths)}개의 이미지가 삽입되었습니다.")
 
-        # 제목 생성
-        if custom_title:
-             blog_title = custom_title
-        else:
-             blog_title = await self._generate_title(region, policy_issues, user_query, needs_classification)
-
-        # 카테고리 분류 (LLM 기반)
-        category = await self._classify_category(blog_content)
-
-        # 해시태그 생성 (LLM 기반)
-        tags = await self._generate_hashtags(blog_content)
-
-        # 메타 설명 생성
-        meta_description = await self._generate_meta_description(
-            region, policy_issues, user_query
-        )
+        # 카테고리 분류 / 해시태그 생성 (LLM 1회 호출)
+        category, tags = await self._generate_category_and_hashtags(blog_content)
 
         return RegionalAnalysisContent(
             region=region,
@@ -174,6 +286,11 @@ class ContentGenerator:
         Returns:
             추출된 키워드 리스트
         """
+        cache_key = _digest("extract_keywords", str(top_n), *texts)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             from krwordrank.word import summarize_with_keywords  # type: ignore
 
@@ -185,18 +302,20 @@ class ContentGenerator:
                 if text:
                     preprocessed_texts.append(text)
 
+            # 상위 top_n개만 필요하므로 라이브러리 단계에서부터 잘라서 받음
             keywords = summarize_with_keywords(
-                preprocessed_texts, min_count=1, max_length=10
+                preprocessed_texts, num_keywords=top_n, min_count=1, max_length=10
             )
 
             top_keywords = [
                 keyword
-                for keyword, _ in sorted(
-                    keywords.items(), key=lambda x: x[1], reverse=True
-                )[:top_n]
+                for keyword, _ in heapq.nlargest(
+                    top_n, keywords.items(), key=lambda x: x[1]
+                )
             ]
 
             print(f"[시스템] 키워드 추출 완료: {top_keywords}")
+            self._cache_set(cache_key, tuple(top_keywords))
             return top_keywords
 
         except ImportError:
@@ -208,28 +327,10 @@ class ContentGenerator:
 
     def _get_region_data(self, region: str) -> Optional[Dict]:
         """지역명을 기반으로 프롬프트 데이터를 조회합니다."""
-
-        # 1. 서울 자치구 검색
-        for gu_name, data in SEOUL_GU_PROMPTS.items():
-             # 정확히 일치하거나, 입력 문자열에 키가 포함된 경우 (예: "서울 강남구" -> "강남구")
-            if gu_name == region or gu_name in region:
-                return data
-
-        # '구'가 빠진 경우 (예: "강남" -> "강남구")
-        if region + "구" in SEOUL_GU_PROMPTS:
-            return SEOUL_GU_PROMPTS[region + "구"]
-
-        # 2. 경기 주요 도시 검색
-        for city_name, data in GYEONGGI_CITY_PROMPTS.items():
-            if city_name == region or city_name in region:
-                return data
-
-        # '시'가 빠진 경우 (예: "수원" -> "수원시")
-        if region + "시" in GYEONGGI_CITY_PROMPTS:
-            return GYEONGGI_CITY_PROMPTS[region + "시"]
-
-        print(f"[시스템] '{region}'에 대한 맞춤형 프롬프트 데이터가 없습니다. 기본 설정을 사용합니다.")
-        return None
+        data = _lookup_region_data(region)
+        if data is None:
+            print(f"[시스템] '{region}'에 대한 맞춤형 프롬프트 데이터가 없습니다. 기본 설정을 사용합니다.")
+        return data
 
     # ========================================================
     # Blog Content Generation
@@ -742,6 +843,70 @@ III. 결론
     # Category & Hashtag (Tistory 기능 통합)
     # ========================================================
 
+    async def _generate_category_and_hashtags(
+        self, content: str, max_tags: int = 10
+    ) -> Tuple[str, List[str]]:
+        """카테고리 분류와 해시태그 생성을 한 번의 LLM 호출로 처리합니다.
+
+        JSON 응답 파싱에 실패하면 개별 메서드(_classify_category,
+        _generate_hashtags)로 폴백합니다.
+
+        Args:
+            content: 블로그 글 내용
+            max_tags: 최대 해시태그 개수
+
+        Returns:
+            (카테고리, 해시태그 리스트)
+        """
+        truncated_content = content[:1500] if len(content) > 1500 else content
+
+        cache_key = _digest("category_and_hashtags", str(max_tags), truncated_content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            category, tags = cached
+            return category, list(tags)
+
+        categories_str = "\n".join(f"- {c}" for c in BLOG_CATEGORIES)
+        system_prompt = (
+            "당신은 블로그 카테고리 분류 및 소셜 미디어 마케팅 전문가입니다. "
+            "주어진 블로그 글을 분석하여 카테고리와 해시태그를 함께 생성해주세요.\n"
+            "카테고리는 다음 중 가장 적합한 하나만 선택하세요:\n"
+            f"{categories_str}\n"
+            f"해시태그는 글의 주요 주제와 관련된 검색 최적화용으로 총 {max_tags}개를 #없이 생성하세요.\n"
+            '다음 JSON 형식으로만 출력하세요: {"category": "카테고리", "hashtags": ["태그1", "태그2"]}'
+        )
+
+        try:
+            messages = [
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=f"블로그 글 내용:\n{truncated_content}"),
+            ]
+            response = await self.llm.bind(temperature=0.3).ainvoke(messages)
+
+            text = response.content.strip()
+            if "```json" in text:
+                text = text.split("```json")[1].split("```")[0].strip()
+            elif "```" in text:
+                text = text.split("```")[1].split("```")[0].strip()
+            data = json.loads(text)
+
+            category = str(data["category"]).strip()
+            tags = [tag for tag in (str(t).strip().lstrip("#") for t in data["hashtags"]) if tag]
+            tags = list(dict.fromkeys(tags))[:max_tags]
+            if not category:
+                raise ValueError("빈 카테고리")
+
+        except Exception as e:
+            print(f"[카테고리/해시태그 통합 생성 오류]: {e} → 개별 생성으로 전환")
+            category, tags = await asyncio.gather(
+                self._classify_category(content),
+                self._generate_hashtags(content, max_tags),
+            )
+            return category, tags
+
+        self._cache_set(cache_key, (category, tuple(tags)))
+        return category, tags
+
     async def _classify_category(self, content: str) -> str:
         """블로그 글 내용을 기반으로 카테고리를 분류합니다 (동네핏 카테고리 체계).
 
@@ -751,27 +916,21 @@ III. 결론
         Returns:
             분류된 카테고리
         """
+        categories_str = "\n".join(f"- {c}" for c in BLOG_CATEGORIES)
         system_prompt = (
             "당신은 블로그 카테고리 분류 전문가입니다. 주어진 블로그 글을 분석하여 가장 적합한 카테고리를 하나만 선택해주세요. "
             "다음 중 하나의 카테고리만 선택하세요: \n"
-            "- 동네 소식\n"
-            "- 동네 문화\n"
-            "- 동네 분석\n"
-            "- 동네 임장\n"
-            "- 주택 임장\n"
-            "- 상가 임장\n"
-            "- 부동산학개론\n"
-            "- 부동산 금융\n"
-            "- 부동산 개발\n"
-            "- 부동산 관리\n"
-            "- 부동산 법률 및 제도\n"
-            "- 부동산 정책 및 이슈\n"
-            "- 기타\n"
+            f"{categories_str}\n"
             "선택한 카테고리 이름만 출력해주세요."
         )
 
         truncated_content = content[:1000] if len(content) > 1000 else content
 
+        cache_key = _digest("classify_category", truncated_content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             messages = [
                 SystemMessage(content=system_prompt),
@@ -779,7 +938,9 @@ III. 결론
             ]
             # temperature=0.3 설정
             response = await self.llm.bind(temperature=0.3).ainvoke(messages)
-            return response.content.strip()
+            category = response.content.strip()
+            self._cache_set(cache_key, category)
+            return category
 
         except Exception as e:
             print(f"[카테고리 분류 오류]: {e}")
@@ -805,6 +966,11 @@ III. 결론
 
         truncated_content = content[:1500] if len(content) > 1500 else content
 
+        cache_key = _digest("generate_hashtags", str(max_tags), truncated_content)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             messages = [
                 SystemMessage(content=system_prompt),
@@ -814,11 +980,12 @@ III. 결론
             result = response.content.strip()
 
             # 파싱: 쉼표로 분리하고 # 제거
-            tags = [tag.strip().lstrip("#") for tag in result.split(",") if tag.strip()]
+            tags = [tag for tag in (t.strip().lstrip("#") for t in result.split(",")) if tag]
 
             # 중복 제거 및 최대 개수 제한
-            unique_tags = list(dict.fromkeys(tags))
-            return unique_tags[:max_tags]
+            unique_tags = list(dict.fromkeys(tags))[:max_tags]
+            self._cache_set(cache_key, tuple(unique_tags))
+            return unique_tags
 
         except Exception as e:
             print(f"[해시태그 생성 오류]: {e}")
@@ -853,10 +1020,13 @@ III. 결론
             print(f"[오류] 이미지 생성 중 오류: {e}")
             return ""
 
-    def _download_image(self, image_url: str, save_dir: str = "images") -> str:
+    async def _download_image(
+        self, client: httpx.AsyncClient, image_url: str, save_dir: str = "images"
+    ) -> str:
         """이미지 URL에서 이미지를 다운로드하여 로컬에 저장합니다.
 
         Args:
+            client: 배치 내에서 공유하는 HTTP 클라이언트
             image_url: 다운로드할 이미지 URL
             save_dir: 저장할 디렉토리 (기본값: 현재 모듈 폴더 내 images)
 
@@ -877,7 +1047,7 @@ III. 결론
             filename = f"dalle_{timestamp}_{unique_id}.png"
             filepath = os.path.join(save_dir, filename)
 
-            response = requests.get(image_url, timeout=30)
+            response = await client.get(image_url)
             response.raise_for_status()
 
             with open(filepath, "wb") as f:
@@ -890,7 +1060,25 @@ III. 결론
             print(f"[오류] 이미지 다운로드 중 오류: {e}")
             return ""
 
-    def _insert_images(
+    async def _generate_and_download_images(self, prompts: List[str]) -> List[str]:
+        """여러 이미지를 동시에 생성하고 하나의 HTTP 클라이언트로 다운로드합니다.
+
+        Args:
+            prompts: 이미지 생성 프롬프트 리스트
+
+        Returns:
+            프롬프트 순서대로의 로컬 경로 리스트 (실패한 항목은 빈 문자열)
+        """
+        async with httpx.AsyncClient(timeout=30) as client:
+
+            async def _generate_one(prompt: str) -> str:
+                # DALL-E 클라이언트는 동기식이므로 스레드에서 실행
+                image_url = await asyncio.to_thread(self._generate_image, prompt)
+                return await self._download_image(client, image_url)
+
+            return list(await asyncio.gather(*(_generate_one(p) for p in prompts)))
+
+    async def _insert_images(
         self, content: str, keyword: str, num_images: int = 3
     ) -> Tuple[str, list]:
         """SEO 최적화된 방식으로 콘텐츠에 이미지를 삽입합니다.
@@ -933,7 +1121,7 @@ III. 결론
         # 섹션이 부족한 경우 단락 기반 삽입
         if len(sections) < 2:
             print("[경고] 소제목이 부족하여 단락 기준으로 이미지 배치")
-            paragraphs = [p.strip() for p in content.split("\n\n") if p.strip()]
+            paragraphs = [p for p in (chunk.strip() for chunk in content.split("\n\n")) if p]
             if len(paragraphs) < 3:
                 return content, []
 
@@ -945,23 +1133,22 @@ III. 결론
                 if step * (i + 1) < total_paragraphs
             ]
 
+            downloaded = await self._generate_and_download_images(
+                [f"{keyword} 관련 이미지, {paragraphs[pos][:100]}" for pos in insert_positions]
+            )
+            path_by_position = dict(zip(insert_positions, downloaded, strict=True))
+
             result = []
             image_paths = []
-            image_count = 0
 
             for i, para in enumerate(paragraphs):
                 result.append(para)
-                if image_count < len(insert_positions) and i == insert_positions[image_count]:
-                    image_prompt = f"{keyword} 관련 이미지, {para[:100]}"
-                    image_url = self._generate_image(image_prompt)
-                    if image_url:
-                        local_path = self._download_image(image_url)
-                        if local_path:
-                            alt_text = f"{keyword} 관련 이미지"
-                            image_placeholder = f"{{{{IMAGE:{local_path}|{alt_text}}}}}"
-                            result.append(image_placeholder)
-                            image_paths.append(local_path)
-                    image_count += 1
+                local_path = path_by_position.get(i)
+                if local_path:
+                    alt_text = f"{keyword} 관련 이미지"
+                    image_placeholder = f"{{{{IMAGE:{local_path}|{alt_text}}}}}"
+                    result.append(image_placeholder)
+                    image_paths.append(local_path)
 
             return "\n\n".join(result), image_paths
 
@@ -988,25 +1175,24 @@ III. 결론
 
         result_lines.extend(sections[0]["content"])
 
-        images_to_insert = {}
-        for img_idx, section_idx in enumerate(insert_indices):
-            if section_idx >= len(body_sections):
-                continue
-
+        target_indices = [idx for idx in insert_indices if idx < len(body_sections)]
+        image_prompts = []
+        for img_idx, section_idx in enumerate(target_indices):
             section = body_sections[section_idx]
             section_title = section["title"]
             section_content_preview = " ".join(section["content"][:5])[:200]
 
-            image_prompt = f"{keyword}, {section_title}, {section_content_preview}"
-            print(f"[시스템] 이미지 생성 중 [{img_idx + 1}/{len(insert_indices)}]: '{section_title}'")
+            image_prompts.append(f"{keyword}, {section_title}, {section_content_preview}")
+            print(f"[시스템] 이미지 생성 중 [{img_idx + 1}/{len(target_indices)}]: '{section_title}'")
 
-            image_url = self._generate_image(image_prompt)
-            if image_url:
-                local_path = self._download_image(image_url)
-                if local_path:
-                    alt_text = f"{keyword} - {section_title}"
-                    images_to_insert[section_idx] = {"path": local_path, "alt": alt_text}
-                    image_paths.append(local_path)
+        downloaded = await self._generate_and_download_images(image_prompts)
+
+        images_to_insert = {}
+        for section_idx, local_path in zip(target_indices, downloaded, strict=True):
+            if local_path:
+                alt_text = f"{keyword} - {body_sections[section_idx]['title']}"
+                images_to_insert[section_idx] = {"path": local_path, "alt": alt_text}
+                image_paths.append(local_path)
 
         for i, section in enumerate(body_sections):
             result_lines.extend(section["content"])
@@ -1060,8 +1246,19 @@ III. 결론
         # 카테고리별 섹션 포맷
         category_sections = self._format_category_sections(analysis.category_analyses)
 
-        # 그래프 설명 문단
-        chart_desc = await self._generate_chart_description(analysis)
+        # 그래프 설명 문단 / 제목 / 메타 설명 (서로 독립적이므로 병렬)
+        if custom_title:
+            title_task = _resolved(custom_title)
+        else:
+            title_task = self._generate_title(
+                region, policy_issues, user_query, needs_classification=True
+            )
+
+        chart_desc, blog_title, meta_description = await asyncio.gather(
+            self._generate_chart_description(analysis),
+            title_task,
+            self._generate_meta_description(region, policy_issues, user_query),
+        )
 
         # 지역 컨텍스트 구성
         region_context = ""
@@ -1125,20 +1322,8 @@ III. 결론
             # 폴백: 구조화된 데이터를 직접 마크다운으로 변환
             blog_content = f"# {region} 개발 이벤트 분석\n\n{yearly_table}\n\n{category_sections}\n\n{chart_desc}"
 
-        # 제목 생성
-        if custom_title:
-            blog_title = custom_title
-        else:
-            blog_title = await self._generate_title(
-                region, policy_issues, user_query, needs_classification=True
-            )
-
-        # 카테고리 / 해시태그 / 메타 설명
-        category = await self._classify_category(blog_content)
-        tags = await self._generate_hashtags(blog_content)
-        meta_description = await self._generate_meta_description(
-            region, policy_issues, user_query
-        )
+        # 카테고리 / 해시태그 (본문 기반, LLM 1회 호출)
+        category, tags = await self._generate_category_and_hashtags(blog_content)
 
         # 호재/악재 분리 (하위 호환)
         positive_issues = [i for i in policy_issues if hasattr(i, 'sentiment') and i.sentiment == "positive"]
@@ -1279,10 +1464,8 @@ III. 결론
 
     def classify_category(self, content: str) -> str:
         """동기식 카테고리 분류 (하위 호환성)."""
-        import asyncio
-        return asyncio.run(self._classify_category(content))
+        return _run_sync(self._classify_category(content))
 
     def generate_hashtags(self, content: str, max_tags: int = 10) -> List[str]:
         """동기식 해시태그 생성 (하위 호환성)."""
-        import asyncio
-        return asyncio.run(self._generate_hashtags(content, max_tags))
+        return _run_sync(self._generate_hashtags(content, max_tags))
@@ -1,5 +1,7 @@
 """LangGraph workflow for SEO optimization."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any
 
 from langchain_core.language_models import BaseChatModel
@@ -162,24 +164,35 @@ class SEOWorkflow:
         if selected:
             print(f"  Targets: {selected}")
 
-        # 1. 제목 개선
+        # 1~2, 4. 제목/구조/메타데이터는 원본 초안만 참조하므로 동시에 개선
         title_issues = [i for i in issues if i.category == "title"]
-        if title_issues and should_improve_title:
-            print("  개선 중: 제목...")
-            improved_title = await self.tools.improve_title(draft, issues)
-            if improved_title != draft.title:
-                changes.append(f"제목 변경: '{draft.title}' → '{improved_title}'")
-        else:
-            improved_title = draft.title
-
-        # 2. 구조 개선
         structure_issues = [i for i in issues if i.category == "structure"]
-        if structure_issues and should_improve_structure:
+        metadata_issues = [i for i in issues if i.category == "metadata"]
+
+        run_title = bool(title_issues) and should_improve_title
+        run_structure = bool(structure_issues) and should_improve_structure
+        run_metadata = bool(metadata_issues) and should_improve_metadata
+
+        async def _skip(value: Any) -> Any:
+            return value
+
+        if run_title:
+            print("  개선 중: 제목...")
+        if run_structure:
             print("  개선 중: 콘텐츠 구조...")
-            improved_content = await self.tools.improve_structure(draft, issues)
+        if run_metadata:
+            print("  개선 중: 메타데이터...")
+
+        improved_title, improved_content, metadata = await asyncio.gather(
+            self.tools.improve_title(draft, issues) if run_title else _skip(draft.title),
+            self.tools.improve_structure(draft, issues) if run_structure else _skip(draft.content),
+            self.tools.optimize_metadata(draft, issues) if run_metadata else _skip(None),
+        )
+
+        if run_title and improved_title != draft.title:
+            changes.append(f"제목 변경: '{draft.title}' → '{improved_title}'")
+        if run_structure:
             changes.append("콘텐츠 구조 개선 (H2/H3 헤딩 추가)")
-        else:
-            improved_content = draft.content
 
         # 3. 키워드 및 가독성 개선
         keyword_issues = [i for i in issues if i.category == "keyword"]
@@ -210,11 +223,8 @@ class SEOWorkflow:
             if target_readability_issues:
                 changes.append("가독성 개선 (문장 길이 조절)")
 
-        # 4. 메타데이터 개선
-        metadata_issues = [i for i in issues if i.category == "metadata"]
-        if metadata_issues and should_improve_metadata:
-            print("  개선 중: 메타데이터...")
-            metadata = await self.tools.optimize_metadata(draft, issues)
+        # 4. 메타데이터 반영
+        if metadata is not None:
             improved_category = metadata.get("category", draft.category)
             improved_tags = metadata.get("tags", draft.tags)
             improved_meta_desc = metadata.get(
@@ -313,9 +323,8 @@ class SEOWorkflow:
         """Run the SEO optimization workflow in interactive mode."""
 
         # 1. 초기 분석
-        analysis_state = await self.run_analysis(draft)
-
-        current_state = analysis_state.copy()
+        # 분석 결과는 이 메서드에서만 쓰이므로 복사 없이 그대로 현재 상태로 사용
+        current_state = await self.run_analysis(draft)
 
         available_categories = {
             "title": "제목 (title)",
@@ -324,13 +333,22 @@ class SEOWorkflow:
             "readability": "가독성 (readability)",
             "metadata": "메타데이터 (metadata)"
         }
+        # 메뉴 출력용 항목은 루프 밖에서 한 번만 구성
+        category_items = list(available_categories.items())
+
+        # 상태가 바뀐 경우(최초 진입, 개선 적용)에만 점수를 다시 계산/출력
+        state_changed = True
+        current_score = None
 
         while True:
-            # 현재 점수 확인
-            current_score = current_state.get("improved_score") or current_state["original_score"]
-            print(f"\n" + "="*40)
-            print(f"[시스템] 현재 SEO 점수: {current_score.total_score}점")
-            print("="*40)
+            if state_changed:
+                original_score = current_state["original_score"]
+                improved_score = current_state.get("improved_score")
+                current_score = improved_score or original_score
+                print(f"\n" + "="*40)
+                print(f"[시스템] 현재 SEO 점수: {current_score.total_score}점")
+                print("="*40)
+                state_changed = False
 
             print("\n[개선 옵션]")
             print("1. 전체 자동 개선 (남은 항목 일괄 적용)")
@@ -352,18 +370,17 @@ class SEOWorkflow:
 
             elif choice == "2":
                 print("\n[개선할 항목 선택]")
-                cat_keys = list(available_categories.keys())
-                for idx, key in enumerate(cat_keys, 1):
-                    print(f"{idx}. {available_categories[key]}")
+                for idx, (_, label) in enumerate(category_items, 1):
+                    print(f"{idx}. {label}")
                 print("0. 취소")
 
                 try:
-                    selection = input(f"번호 선택 (1-{len(cat_keys)}): ").strip()
+                    selection = input(f"번호 선택 (1-{len(category_items)}): ").strip()
                     if selection == "0": continue
 
                     idx = int(selection) - 1
-                    if 0 <= idx < len(cat_keys):
-                        selected_categories = [cat_keys[idx]]
+                    if 0 <= idx < len(category_items):
+                        selected_categories = [category_items[idx][0]]
                     else:
                         print("[오류] 올바른 번호를 입력하세요.")
                         continue
@@ -385,7 +402,14 @@ class SEOWorkflow:
                  # 따라서 이슈가 갱신되지 않으면 옛날 이슈를 계속 고치려 할 수 있음.
                  # 하지만 interactive mode에서는 사용자가 "이거 고쳐" 하면 고치는 식.
 
-            improve_result = await self.run_improvement(input_state, selected_categories)
+            # 노드 단위로 진행 상황을 받아 단계가 끝날 때마다 바로 보여줌
+            improve_result = input_state
+            async for node_name, node_state in self.stream_improvement(
+                input_state, selected_categories
+            ):
+                improve_result = node_state
+                if node_name == "improve_content":
+                    print("[진행] 콘텐츠 개선 완료, 점수 재계산 중...")
 
             new_score = improve_result["improved_score"]
             improved_draft = improve_result["improved_draft"]
@@ -406,6 +430,7 @@ class SEOWorkflow:
 
             if confirm == 'y':
                 current_state = improve_result
+                state_changed = True
                 print("[알림] 개선사항이 적용되었습니다.")
 
                 # 성공 시 카테고리 제거 표시는 생략 (복잡도 감소)
@@ -431,6 +456,20 @@ class SEOWorkflow:
         print("\n[시스템] Analysis complete!")
         return result
 
+    async def stream_improvement(
+        self, state: dict[str, Any], selected_categories: list[str] = None
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Run the improvement phase, yielding (node name, state) after each node."""
+        current_state = state.copy()
+        if selected_categories:
+            current_state["selected_categories"] = selected_categories
+
+        print(f"[시스템] Starting improvement phase (Selected: {selected_categories})...\n")
+        async for update in self.improvement_graph.astream(current_state, stream_mode="updates"):
+            for node_name, node_state in update.items():
+                yield node_name, node_state
+        print("\n[시스템] Improvement complete!")
+
     async def run_improvement(self, state: dict[str, Any], selected_categories: list[str] = None) -> dict[str, Any]:
         """Run the improvement phase with optional selection."""
         # 상태 업데이트
@@ -4,7 +4,10 @@ Central Supervisor Router가 현재 상태를 분석하고,
 다음에 실행할 Worker 노드를 자율적으로 결정합니다.
 """
 
+import asyncio
 import json
+import re
+import sys
 from typing import Any, Dict
 
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -37,7 +40,22 @@ from app.core.agent.models import (
 from app.core.agent.sub_agents.seo.models import BlogDraft
 from app.core.agent.sub_agents.seo.tools import SEOTools
 from app.core.agent.sub_agents.seo.workflow import build_seo_workflow
-from app.core.agent.tools.tistory_publisher import TistoryWriter
+
+# 쉼표로 구분된 태그 입력에서 앞뒤 공백을 제외한 각 항목을 추출
+_TAG_SPLIT_RE = re.compile(r"[^,\s][^,]*[^,\s]|[^,\s]")
+
+# y/n 프롬프트에서 '예'로 인정하는 입력 (소문자 기준)
+_YES_ANSWERS = frozenset({"y", "yes", "true", "1"})
+
+
+def _fast_input(prompt: str) -> str:
+    """input() 대체. stderr flush 등 부가 작업 없이 stdout/stdin만 사용합니다."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
 
 
 class SupervisorAgent:
@@ -83,6 +101,9 @@ class SupervisorAgent:
         self.content_generator = ContentGenerator(llm_provider=llm_provider)
         self.seo_workflow = build_seo_workflow(llm_provider=llm_provider)
 
+        # 티스토리 브라우저 로그인 (콘텐츠 생성과 병렬로 미리 수행)
+        self._writer_future: asyncio.Future | None = None
+
         # 그래프 빌드
         self.graph = self._build_graph()
 
@@ -187,12 +208,14 @@ class SupervisorAgent:
                 reason = f"최대 시도 횟수({self.MAX_SEO_RETRIES}) 도달. 현재 점수: {seo_score}점."
 
         # 발행 단계 확인
-        if next_action == FINISH and not post_url and has_content: # has_content 체크 추가 (데이터 수집 실패 시 content 없음)
+        # post_url이 빈 문자열이면 이미 발행을 시도했다가 실패한 상태 (재시도 안 함)
+        if next_action == FINISH and post_url is None and has_content: # has_content 체크 추가 (데이터 수집 실패 시 content 없음)
             # 콘텐츠가 있고 SEO가 완료되었는데 발행되지 않았다면 발행 시도
-            if has_content and settings.tistory_id and settings.tistory_password:
-                # 사용자 요청으로 자동 발행 일시 중지
-                # next_action = PUBLISH_CONTENT
-                # reason = "SEO 최적화 완료. 티스토리에 발행합니다."
+            if has_content and self._can_publish():
+                next_action = PUBLISH_CONTENT
+                reason = "SEO 최적화 완료. 티스토리에 발행합니다."
+            elif has_content and settings.tistory_id and settings.tistory_password:
+                # TISTORY_AUTO_PUBLISH가 꺼져 있으면 발행하지 않음
                 reason += " (자동 발행 일시 중지됨)"
             elif has_content and not (settings.tistory_id and settings.tistory_password):
                 reason += " (티스토리 계정 설정 없음으로 발행 건너뜀)"
@@ -399,6 +422,9 @@ class SupervisorAgent:
         print("\n[Content Generator] 콘텐츠 생성 시작...")
         steps_log = state.get("steps_log", [])
 
+        # 발행 예정이면 브라우저 실행 + 로그인을 콘텐츠 생성과 겹쳐서 진행
+        self._start_writer_warmup()
+
         try:
             policy_issues = state.get("policy_issues", [])
             admin_region = state.get("admin_region")
@@ -415,18 +441,18 @@ class SupervisorAgent:
             if self.interactive:
                 print("\n" + "="*40)
                 print("[인터랙티브] 콘텐츠 생성 설정")
-                use_custom = input("사용자 입력을 통해 키워드/제목 등을 직접 설정하시겠습니까? (y/n) [n]: ").strip().lower()
+                use_custom = _fast_input("사용자 입력을 통해 키워드/제목 등을 직접 설정하시겠습니까? (y/n) [n]: ").strip().lower() in _YES_ANSWERS
 
-                if use_custom == 'y':
+                if use_custom:
                     # 키워드 설정
                     print(f"\n현재 키워드 (지역/주제): {region_name}")
-                    new_keyword = input(f"새 키워드를 입력하세요 (엔터: 유지): ").strip()
+                    new_keyword = _fast_input(f"새 키워드를 입력하세요 (엔터: 유지): ").strip()
                     if new_keyword:
                         region_name = new_keyword
                         print(f"키워드가 변경되었습니다: {region_name}")
 
                     # 제목 설정
-                    new_title = input("사용할 블로그 제목을 입력하세요 (엔터: 자동 생성): ").strip()
+                    new_title = _fast_input("사용할 블로그 제목을 입력하세요 (엔터: 자동 생성): ").strip()
                     if new_title:
                         custom_title = new_title
                         print(f"제목이 설정되었습니다: {custom_title}")
@@ -450,7 +476,7 @@ class SupervisorAgent:
             if self.interactive:
                 if not custom_title:
                     print(f"\n[인터랙티브] 생성된 제목: {content.blog_title}")
-                    user_title = input("이 제목을 사용하시겠습니까? (엔터: 예, 또는 새 제목 입력): ").strip()
+                    user_title = _fast_input("이 제목을 사용하시겠습니까? (엔터: 예, 또는 새 제목 입력): ").strip()
                     if user_title:
                         content.blog_title = user_title
                         print(f"제목이 변경되었습니다: {content.blog_title}")
@@ -458,19 +484,19 @@ class SupervisorAgent:
                 # 카테고리/태그 설정
                 print(f"\n[인터랙티브] 분류 및 태그 설정")
                 print(f"현재 카테고리: {content.category}")
-                new_category = input("카테고리를 변경하시겠습니까? (엔터: 유지, 또는 새 카테고리 입력): ").strip()
+                new_category = _fast_input("카테고리를 변경하시겠습니까? (엔터: 유지, 또는 새 카테고리 입력): ").strip()
                 if new_category:
                     content.category = new_category
 
                 print(f"현재 태그: {', '.join(content.tags)}")
-                change_tags = input("태그를 수정하시겠습니까? (y/n) [n]: ").strip().lower()
-                if change_tags == 'y':
-                    tags_input = input("새 태그를 쉼표로 구분하여 입력하세요: ").strip()
+                change_tags = _fast_input("태그를 수정하시겠습니까? (y/n) [n]: ").strip().lower()
+                if change_tags in _YES_ANSWERS:
+                    tags_input = _fast_input("새 태그를 쉼표로 구분하여 입력하세요: ").strip()
                     if tags_input:
-                        content.tags = [t.strip() for t in tags_input.split(",") if t.strip()]
+                        content.tags = _TAG_SPLIT_RE.findall(tags_input)
 
             # target_keyword 설정
-            if self.interactive and use_custom == 'y' and region_name != (admin_region.full_address if admin_region else state["user_query"]):
+            if self.interactive and use_custom and region_name != (admin_region.full_address if admin_region else state["user_query"]):
                 keyword = region_name
             else:
                 keyword = admin_region.sigungu if admin_region else state["user_query"]
@@ -565,16 +591,10 @@ class SupervisorAgent:
         print("\n[Tistory Publisher] 블로그 발행 시작...")
         steps_log = state.get("steps_log", [])
 
-        import asyncio
         loop = asyncio.get_running_loop()
 
-        def _publish_sync(content):
-            # TistoryWriter 초기화 (Selenium 브라우저 실행)
-            writer = TistoryWriter(settings.tistory_id, settings.tistory_password)
+        def _publish_sync(writer, content):
             try:
-                # 로그인
-                writer.login()
-
                 # 글 작성
                 image_paths = getattr(content, "image_paths", [])
 
@@ -592,8 +612,13 @@ class SupervisorAgent:
         try:
             content = state["final_content"]
 
+            # 미리 로그인해 둔 브라우저가 있으면 재사용
+            self._start_writer_warmup(force=True)
+            writer_future, self._writer_future = self._writer_future, None
+            writer = await writer_future
+
             # 별도 스레드에서 실행 (Selenium 블로킹 방지)
-            post_url = await loop.run_in_executor(None, _publish_sync, content)
+            post_url = await loop.run_in_executor(None, _publish_sync, writer, content)
 
             log = f"[Publisher] 티스토리 발행 완료: {content.blog_title}"
             print(f"  [OK] {log}")
@@ -613,6 +638,7 @@ class SupervisorAgent:
             # 발행 실패해도 전체 프로세스는 성공으로 간주 (콘텐츠는 생성되었으므로)
             return {
                 **state,
+                "post_url": "",
                 "error": error_msg,
                 "steps_log": steps_log
             }
@@ -621,6 +647,44 @@ class SupervisorAgent:
     # Helper Methods
     # ========================================================
 
+    def _can_publish(self) -> bool:
+        """자동 발행이 켜져 있고 티스토리 계정이 설정되어 있는지 확인합니다."""
+        return bool(
+            settings.tistory_auto_publish and settings.tistory_id and settings.tistory_password
+        )
+
+    def _start_writer_warmup(self, force: bool = False) -> None:
+        """TistoryWriter 브라우저 실행 및 로그인을 백그라운드 스레드에서 시작합니다."""
+        if self._writer_future is not None or not (force or self._can_publish()):
+            return
+
+        def _login_sync():
+            # Selenium은 발행할 때만 필요하므로 지연 import
+            from app.core.agent.tools.tistory_publisher import TistoryWriter
+
+            # TistoryWriter 초기화 (Selenium 브라우저 실행) 및 로그인
+            writer = TistoryWriter(settings.tistory_id, settings.tistory_password)
+            try:
+                writer.login()
+            except Exception:
+                writer.close()
+                raise
+            return writer
+
+        loop = asyncio.get_running_loop()
+        self._writer_future = loop.run_in_executor(None, _login_sync)
+
+    async def _close_pending_writer(self) -> None:
+        """발행에 사용되지 않은 브라우저를 정리합니다."""
+        if self._writer_future is None:
+            return
+        writer_future, self._writer_future = self._writer_future, None
+        try:
+            writer = await writer_future
+        except Exception:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, writer.close)
+
     def _extract_region_from_query(self, query: str):
         """사용자 쿼리에서 지역 정보를 추출합니다."""
         try:
@@ -633,16 +697,17 @@ class SupervisorAgent:
     # Public Interface
     # ========================================================
 
-    async def run(self, user_query: str) -> Dict[str, Any]:
-        """에이전트를 실행합니다.
+    def build_initial_state(self, user_query: str, **overrides: Any) -> SupervisorState:
+        """그래프 실행용 초기 상태를 생성합니다.
 
         Args:
-            user_query: 사용자 자연어 쿼리 (예: "강남역 호재 알려줘")
+            user_query: 사용자 자연어 쿼리
+            **overrides: 미리 채워 둘 상태 값 (예: 이미 수집한 기사, 분석 결과)
 
         Returns:
-            최종 상태 딕셔너리
+            초기 상태 딕셔너리
         """
-        initial_state: SupervisorState = {
+        state: SupervisorState = {
             "user_query": user_query,
             "admin_region": None,
             "intent_analysis": None,
@@ -659,12 +724,32 @@ class SupervisorAgent:
             "error": None,
             "post_url": None,
         }
+        state.update(overrides)
+        return state
+
+    async def invoke(self, state: SupervisorState) -> Dict[str, Any]:
+        """주어진 상태에서 그래프를 실행하고, 사용되지 않은 발행 브라우저를 정리합니다."""
+        try:
+            return await self.graph.ainvoke(state)
+        finally:
+            await self._close_pending_writer()
+
+    async def run(self, user_query: str) -> Dict[str, Any]:
+        """에이전트를 실행합니다.
+
+        Args:
+            user_query: 사용자 자연어 쿼리 (예: "강남역 호재 알려줘")
+
+        Returns:
+            최종 상태 딕셔너리
+        """
+        initial_state = self.build_initial_state(user_query)
 
         print("\n" + "=" * 60)
         print(f"[Supervisor Agent] 시작: \"{user_query}\"")
         print("=" * 60)
 
-        result = await self.graph.ainvoke(initial_state)
+        result = await self.invoke(initial_state)
 
         print("\n" + "=" * 60)
         if result.get("error") and not result.get("final_content"):
@@ -1,3 +1,4 @@
+import logging
 import os
 import time
 
@@ -7,6 +8,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+logger = logging.getLogger(__name__)
+
 
 # 티스토리 작성 클래스
 class TistoryWriter:
@@ -46,7 +49,7 @@ class TistoryWriter:
         # 로그인 완료 대기
         WebDriverWait(self.driver, 15).until(EC.url_contains("tistory.com"))
         time.sleep(5)
-        print("✅ 로그인 완료")
+        logger.info("로그인 완료")
 
     # 게시글 작성
     def write_post(self, blog_title, blog_content, category_name, hashtags, image_paths=None):
@@ -87,7 +90,7 @@ class TistoryWriter:
             EC.element_to_be_clickable((By.ID, "editor-mode-markdown"))
         )
         markdown_option.click()
-        print("✅ 마크다운 모드 선택")
+        logger.info("마크다운 모드 선택")
 
         # 알림창 확인
         WebDriverWait(self.driver, 5).until(EC.alert_is_present())
@@ -100,7 +103,7 @@ class TistoryWriter:
         )
         title_input.clear()
         title_input.send_keys(blog_title)
-        print("✅ 제목 입력 완료")
+        logger.info("제목 입력 완료")
 
         # 먼저 플레이스홀더가 포함된 본문 입력
         cm_div = self.driver.find_element(
@@ -126,11 +129,11 @@ class TistoryWriter:
         text_area = cm_div.find_element(By.CSS_SELECTOR, "textarea")
         text_area.send_keys(".")
         self.driver.execute_script("arguments[0].CodeMirror.save();", cm_div)
-        print("✅ 본문 입력 완료 (플레이스홀더 포함)")
+        logger.info("본문 입력 완료 (플레이스홀더 포함)")
 
         # 이미지 업로드 및 본문 내 플레이스홀더 치환
         if image_paths:
-            print(f"🖼️ {len(image_paths)}개의 이미지 업로드 시작...")
+            logger.info(f"{len(image_paths)}개의 이미지 업로드 시작...")
             import re
             
             for image_path in image_paths:
@@ -170,7 +173,7 @@ class TistoryWriter:
                         cm_div,
                         updated_content
                     )
-                    print(f"✅ 이미지 플레이스홀더 치환 완료: {image_path}")
+                    logger.info(f"이미지 플레이스홀더 치환 완료: {image_path}")
                 else:
                     # 업로드 실패 시 플레이스홀더 제거
                     current_content = self.driver.execute_script(
@@ -187,9 +190,9 @@ class TistoryWriter:
                         cm_div,
                         updated_content
                     )
-                    print(f"⚠️ 이미지 업로드 실패, 플레이스홀더 제거: {image_path}")
+                    logger.warning(f"이미지 업로드 실패, 플레이스홀더 제거: {image_path}")
             
-            print(f"✅ {len(image_paths)}개의 이미지 처리 완료")
+            logger.info(f"{len(image_paths)}개의 이미지 처리 완료")
 
         # 카테고리 선택
         self.select_category(category_name)
@@ -213,16 +216,16 @@ class TistoryWriter:
             str: 업로드된 이미지의 티스토리 URL (업로드 실패 시 빈 문자열)
         """
         if not os.path.exists(image_path):
-            print(f"❌ 이미지 파일이 존재하지 않습니다: {image_path}")
+            logger.error(f"이미지 파일이 존재하지 않습니다: {image_path}")
             return ""
 
         try:
             # 절대 경로로 변환
             abs_image_path = os.path.abspath(image_path)
-            print(f"📤 이미지 업로드 시작: {abs_image_path}")
+            logger.info(f"이미지 업로드 시작: {abs_image_path}")
             
             # 1. 먼저 CodeMirror가 있는 컨텍스트 찾기 (가장 중요)
-            print("🔍 CodeMirror 에디터 찾는 중...")
+            logger.debug("CodeMirror 에디터 찾는 중...")
             cm_div = None
             current_context = "메인"
             
@@ -232,14 +235,14 @@ class TistoryWriter:
                 cm_div = self.driver.find_element(
                     By.CSS_SELECTOR, ".CodeMirror.cm-s-tistory-markdown.CodeMirror-wrap"
                 )
-                print("✅ CodeMirror 발견: 메인 컨텍스트")
+                logger.info("CodeMirror 발견: 메인 컨텍스트")
                 current_context = "메인"
             except:
                 # iframe들에서 시도
-                print("⚠️ 메인 컨텍스트에서 CodeMirror 없음, iframe 확인 중...")
+                logger.warning("메인 컨텍스트에서 CodeMirror 없음, iframe 확인 중...")
                 self.driver.switch_to.default_content()
                 iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-                print(f"📋 {len(iframes)}개의 iframe 발견")
+                logger.debug(f"{len(iframes)}개의 iframe 발견")
                 
                 for i, iframe in enumerate(iframes):
                     try:
@@ -248,14 +251,14 @@ class TistoryWriter:
                         cm_div = self.driver.find_element(
                             By.CSS_SELECTOR, ".CodeMirror.cm-s-tistory-markdown.CodeMirror-wrap"
                         )
-                        print(f"✅ CodeMirror 발견: iframe[{i}]")
+                        logger.info(f"CodeMirror 발견: iframe[{i}]")
                         current_context = f"iframe[{i}]"
                         break
                     except:
                         continue
             
             if not cm_div:
-                print("❌ CodeMirror 에디터를 찾을 수 없습니다.")
+                logger.error("CodeMirror 에디터를 찾을 수 없습니다.")
                 raise Exception("CodeMirror 에디터를 찾을 수 없습니다")
             
             # 2. 현재 에디터 내용 저장 (비교를 위해)
@@ -266,12 +269,12 @@ class TistoryWriter:
             if not before_content:
                 before_content = ""
             
-            print(f"📝 현재 에디터 내용 길이: {len(before_content)}자")
+            logger.debug(f"현재 에디터 내용 길이: {len(before_content)}자")
             
             # 3. 메인 컨텍스트로 돌아가서 첨부 버튼 찾기
             self.driver.switch_to.default_content()
             
-            print("🔍 첨부 버튼 찾는 중...")
+            logger.debug("첨부 버튼 찾는 중...")
             # JavaScript로 직접 버튼 찾기 및 클릭
             try:
                 button_clicked = self.driver.execute_script("""
@@ -283,15 +286,15 @@ class TistoryWriter:
                     return false;
                 """)
                 if button_clicked:
-                    print("✅ 첨부 버튼 클릭 완료 (JavaScript)")
+                    logger.info("첨부 버튼 클릭 완료 (JavaScript)")
                     time.sleep(1)
                 else:
-                    print("⚠️ 첨부 버튼을 찾을 수 없음 (JavaScript)")
+                    logger.warning("첨부 버튼을 찾을 수 없음 (JavaScript)")
             except Exception as e:
-                print(f"⚠️ 첨부 버튼 클릭 실패: {e}")
+                logger.warning(f"첨부 버튼 클릭 실패: {e}")
             
             # 4. 파일 input 찾기 - JavaScript로 직접 접근
-            print("🔍 파일 입력 요소 찾는 중...")
+            logger.debug("파일 입력 요소 찾는 중...")
             try:
                 # JavaScript로 파일 input 존재 확인
                 input_exists = self.driver.execute_script("""
@@ -299,18 +302,18 @@ class TistoryWriter:
                 """)
                 
                 if input_exists:
-                    print("✅ 파일 입력 요소 발견 (JavaScript): #attach-image")
+                    logger.info("파일 입력 요소 발견 (JavaScript): #attach-image")
                     
                     # Selenium으로 파일 input 찾기
                     file_input = self.driver.find_element(By.ID, "attach-image")
                 else:
-                    print("❌ 파일 입력 요소를 찾을 수 없습니다")
+                    logger.error("파일 입력 요소를 찾을 수 없습니다")
                     raise Exception("파일 입력 요소 없음")
                     
             except Exception as e:
-                print(f"❌ 파일 입력 요소를 찾을 수 없습니다: {e}")
+                logger.error(f"파일 입력 요소를 찾을 수 없습니다: {e}")
                 # Base64 fallback
-                print("💡 대안: base64 인코딩 사용...")
+                logger.info("대안: base64 인코딩 사용...")
                 import base64
                 with open(abs_image_path, 'rb') as img_file:
                     img_data = base64.b64encode(img_file.read()).decode()
@@ -319,10 +322,10 @@ class TistoryWriter:
             
             # 5. 파일 경로 전송
             file_input.send_keys(abs_image_path)
-            print("✅ 파일 경로 전송 완료")
+            logger.info("파일 경로 전송 완료")
             
             # 6. 업로드 완료 대기
-            print("⏳ 이미지 업로드 중...")
+            logger.info("이미지 업로드 중...")
             time.sleep(4)
             
             # 7. CodeMirror가 있던 컨텍스트로 다시 전환
@@ -342,7 +345,7 @@ class TistoryWriter:
             if not after_content:
                 after_content = ""
             
-            print(f"📝 업로드 후 에디터 내용 길이: {len(after_content)}자")
+            logger.debug(f"업로드 후 에디터 내용 길이: {len(after_content)}자")
             
             # 9. 마크다운 이미지 문법에서 URL 추출
             import re
@@ -356,7 +359,7 @@ class TistoryWriter:
             
             if new_images:
                 uploaded_url = list(new_images)[0]
-                print(f"✅ 이미지 업로드 완료: {uploaded_url}")
+                logger.info(f"이미지 업로드 완료: {uploaded_url}")
                 
                 # 업로드된 이미지를 에디터에서 제거 (나중에 올바른 위치에 삽입하기 위함)
                 for match in re.finditer(image_pattern, after_content):
@@ -377,11 +380,11 @@ class TistoryWriter:
                 self.driver.switch_to.default_content()
                 return uploaded_url
             else:
-                print("❌ 업로드된 이미지 URL을 찾을 수 없습니다.")
-                print(f"이전 이미지 수: {len(before_matches)}, 이후 이미지 수: {len(after_matches)}")
+                logger.error("업로드된 이미지 URL을 찾을 수 없습니다.")
+                logger.info(f"이전 이미지 수: {len(before_matches)}, 이후 이미지 수: {len(after_matches)}")
                 
                 # Base64 fallback
-                print("💡 대안: base64 인코딩 사용...")
+                logger.info("대안: base64 인코딩 사용...")
                 import base64
                 with open(abs_image_path, 'rb') as img_file:
                     img_data = base64.b64encode(img_file.read()).decode()
@@ -390,7 +393,7 @@ class TistoryWriter:
                     return data_url
                 
         except Exception as e:
-            print(f"❌ 이미지 업로드 중 오류 발생: {e}")
+            logger.error(f"이미지 업로드 중 오류 발생: {e}")
             import traceback
             traceback.print_exc()
             
@@ -402,7 +405,7 @@ class TistoryWriter:
             
             # Base64 fallback
             try:
-                print("💡 대안: base64 인코딩 사용...")
+                logger.info("대안: base64 인코딩 사용...")
                 import base64
                 abs_path = os.path.abspath(image_path)
                 with open(abs_path, 'rb') as img_file:
@@ -410,7 +413,7 @@ class TistoryWriter:
                     data_url = f"data:image/png;base64,{img_data}"
                     return data_url
             except Exception as e2:
-                print(f"❌ Base64 인코딩도 실패: {e2}")
+                logger.error(f"Base64 인코딩도 실패: {e2}")
                 return ""
 
     # 카테고리 선택
@@ -436,7 +439,7 @@ class TistoryWriter:
                 label = label.strip()
                 if category_name.strip() == label or category_name.strip() in label:
                     item.click()
-                    print(f"✅ '{label}' 카테고리 선택 완료")
+                    logger.info(f"'{label}' 카테고리 선택 완료")
                     found = True
                     break
 
@@ -446,7 +449,7 @@ class TistoryWriter:
                 By.CSS_SELECTOR, "div[aria-label='카테고리 없음']"
             )
             no_category_item.click()
-            print("⚠ 지정된 카테고리가 없어 '카테고리 없음'으로 설정")
+            logger.warning("지정된 카테고리가 없어 '카테고리 없음'으로 설정")
         time.sleep(1)
 
     # 해시태그 입력
@@ -459,7 +462,7 @@ class TistoryWriter:
             tag_input.send_keys(tag)
             tag_input.send_keys("\ue004")  # TAB 키 입력 (엔터 대신)
             time.sleep(0.3)
-        print("✅ 해시태그 입력 완료")
+        logger.info("해시태그 입력 완료")
 
     # 게시글 발행
     def publish_post(self):
@@ -474,7 +477,7 @@ class TistoryWriter:
             EC.element_to_be_clickable((By.ID, "publish-btn"))
         )
         publish_button.click()
-        print("✅ 게시글 발행 완료")
+        logger.info("게시글 발행 완료")
 
     # 브라우저 종료
     def close(self):
@@ -1,11 +1,34 @@
 """Base CRUD operations."""
 
-from typing import Any, TypeVar
+from collections.abc import Callable
+from typing import Any
 
+from sqlalchemy import delete, event, insert, lambda_stmt, true, update
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql import Select
 from sqlmodel import SQLModel, func, select
 
-ModelType = TypeVar("ModelType", bound=SQLModel)
+
+def safe_list(stmt: Select, *loads: Any) -> Select:
+    """Apply explicit eager ``loads`` and make any other lazy load raise.
+
+    List queries use this so an accidental per-row lazy load (which would run
+    under ``greenlet_spawn`` in async code) fails loudly instead of issuing
+    N extra queries; relationships needed by the caller must be opted in,
+    e.g. ``safe_list(stmt, selectinload(Model.children))``.
+    """
+    return stmt.options(*loads, raiseload("*"))
+
+
+def on_commit(db: AsyncSession, callback: Callable[[], None]) -> None:
+    """Run ``callback`` once the session's current transaction commits.
+
+    Process-level caches are invalidated this way rather than before the
+    write, so a concurrent read cannot re-cache rows the commit replaces.
+    """
+    event.listen(db.sync_session, "after_commit", lambda _session: callback(), once=True)
 
 
 class CRUDBase[ModelType: SQLModel]:
@@ -13,11 +36,16 @@ class CRUDBase[ModelType: SQLModel]:
 
     def __init__(self, model: type[ModelType]):
         self.model = model
+        # Column names, so update() can check fields without hasattr()
+        self._fields = frozenset(attr.key for attr in sa_inspect(model).column_attrs)
 
     async def get(self, db: AsyncSession, id: Any) -> ModelType | None:
-        """Get a single record by ID."""
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
+        """Get a single record by ID.
+
+        Uses the session's identity map first, so a row already loaded in the
+        same request is returned without another SELECT.
+        """
+        return await db.get(self.model, id)
 
     async def get_multi(
         self,
@@ -27,21 +55,58 @@ class CRUDBase[ModelType: SQLModel]:
         limit: int = 100,
     ) -> list[ModelType]:
         """Get multiple records with pagination."""
-        result = await db.execute(select(self.model).offset(offset).limit(limit))
+        model = self.model
+        result = await db.execute(
+            lambda_stmt(lambda: safe_list(select(model)).offset(offset).limit(limit))
+        )
         return list(result.scalars().all())
 
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        where_clause: Any = true(),
+        order_by: Any = None,
+        offset: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[ModelType], int]:
+        """Get a page of records together with the total match count.
+
+        The total is read from a ``COUNT(*) OVER ()`` column on the page query,
+        so a separate COUNT round-trip is only needed when a page past the
+        first one (or a ``limit=0`` page) comes back empty. ``order_by`` may be
+        a single clause or a tuple of clauses.
+        """
+        stmt = safe_list(select(self.model, func.count().over().label("total"))).where(where_clause)
+        if isinstance(order_by, tuple):
+            stmt = stmt.order_by(*order_by)
+        elif order_by is not None:
+            stmt = stmt.order_by(order_by)
+        result = await db.execute(stmt.offset(offset).limit(limit))
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
+        if offset == 0 and limit > 0:
+            return [], 0
+
+        count_result = await db.execute(
+            select(func.count()).select_from(self.model).where(where_clause)
+        )
+        return [], count_result.scalar() or 0
+
     async def count(self, db: AsyncSession) -> int:
         """Count total records."""
         result = await db.execute(select(func.count()).select_from(self.model))
         return result.scalar() or 0
 
     async def create(self, db: AsyncSession, *, obj_in: dict[str, Any]) -> ModelType:
-        """Create a new record."""
-        db_obj = self.model(**obj_in)
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        """Create a new record.
+
+        ``INSERT ... RETURNING`` brings back every column, server defaults
+        included, so the instance is populated in a single round-trip.
+        """
+        result = await db.execute(insert(self.model).values(**obj_in).returning(self.model))
+        return result.scalar_one()
 
     async def update(
         self,
@@ -52,17 +117,39 @@ class CRUDBase[ModelType: SQLModel]:
     ) -> ModelType:
         """Update an existing record."""
         for field, value in obj_in.items():
-            if hasattr(db_obj, field):
+            if field in self._fields:
                 setattr(db_obj, field, value)
         db.add(db_obj)
         await db.flush()
-        await db.refresh(db_obj)
         return db_obj
 
+    async def update_by_id(
+        self,
+        db: AsyncSession,
+        *,
+        id: Any,
+        values: dict[str, Any],
+    ) -> ModelType | None:
+        """Update a record with a single ``UPDATE ... RETURNING``.
+
+        ``values`` may contain SQL expressions (e.g. ``sql_utc_now()``); the
+        returned row refreshes any instance already loaded in the session, so
+        pending changes are flushed first rather than overwritten.
+        """
+        await db.flush()
+        result = await db.execute(
+            update(self.model).where(self.model.id == id).values(**values).returning(self.model),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalar_one_or_none()
+
     async def delete(self, db: AsyncSession, *, id: Any) -> ModelType | None:
-        """Delete a record by ID."""
-        obj = await self.get(db, id)
-        if obj:
-            await db.delete(obj)
-            await db.flush()
-        return obj
+        """Delete a record by ID.
+
+        Issues a single ``DELETE ... RETURNING`` instead of loading the row first;
+        related rows are removed by the database's ``ON DELETE`` rules.
+        """
+        result = await db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model)
+        )
+        return result.scalar_one_or_none()
@@ -1,9 +1,13 @@
 """CRUD operations for discussions."""
 
+from collections.abc import AsyncIterator
+
+from sqlalchemy import ColumnElement, delete, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import and_, func, or_, select
+from sqlmodel import and_, exists, func, or_, select
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, safe_list
 from app.models.discussion import Discussion, DiscussionLike, DiscussionReply
 from app.schemas.discussion import (
     DiscussionCreate,
@@ -16,13 +20,9 @@ from app.schemas.discussion import (
 class CRUDDiscussion(CRUDBase[Discussion]):
     """CRUD operations for Discussion model."""
 
-    async def get_multi_with_query(
-        self,
-        db: AsyncSession,
-        *,
-        query: DiscussionQuery,
-    ) -> tuple[list[Discussion], int]:
-        """Get discussions with filtering and pagination."""
+    @staticmethod
+    def _build_where(query: DiscussionQuery) -> ColumnElement[bool]:
+        """Build the WHERE clause shared by the page and count queries."""
         conditions = []
 
         if query.search:
@@ -43,7 +43,16 @@ class CRUDDiscussion(CRUDBase[Discussion]):
         if query.type:
             conditions.append(Discussion.type == query.type.value)
 
-        where_clause = and_(*conditions) if conditions else True
+        return and_(*conditions) if conditions else true()
+
+    async def get_multi_with_query(
+        self,
+        db: AsyncSession,
+        *,
+        query: DiscussionQuery,
+    ) -> tuple[list[Discussion], int]:
+        """Get discussions with filtering and pagination."""
+        where_clause = self._build_where(query)
 
         # Order by
         order_by = Discussion.created_at.desc()
@@ -52,23 +61,13 @@ class CRUDDiscussion(CRUDBase[Discussion]):
         elif query.sort_by == "most_replies":
             order_by = Discussion.reply_count.desc()
 
-        # Get discussions
-        result = await db.execute(
-            select(Discussion)
-            .where(where_clause)
-            .order_by(order_by)
-            .offset(query.offset)
-            .limit(query.limit)
-        )
-        discussions = list(result.scalars().all())
-
-        # Get total count
-        count_result = await db.execute(
-            select(func.count()).select_from(Discussion).where(where_clause)
+        return await self.get_page(
+            db,
+            where_clause=where_clause,
+            order_by=order_by,
+            offset=query.offset,
+            limit=query.limit,
         )
-        total = count_result.scalar() or 0
-
-        return discussions, total
 
     async def create_discussion(
         self,
@@ -78,17 +77,16 @@ class CRUDDiscussion(CRUDBase[Discussion]):
         obj_in: DiscussionCreate,
     ) -> Discussion:
         """Create a new discussion."""
-        db_obj = Discussion(
-            user_id=user_id,
-            neighborhood_id=obj_in.neighborhood_id,
-            title=obj_in.title,
-            content=obj_in.content,
-            type=obj_in.type.value,
+        return await self.create(
+            db,
+            obj_in={
+                "user_id": user_id,
+                "neighborhood_id": obj_in.neighborhood_id,
+                "title": obj_in.title,
+                "content": obj_in.content,
+                "type": obj_in.type.value,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def update_discussion(
         self,
@@ -98,24 +96,27 @@ class CRUDDiscussion(CRUDBase[Discussion]):
         obj_in: DiscussionUpdate,
     ) -> Discussion:
         """Update a discussion."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         if "type" in update_data:
             update_data["type"] = update_data["type"].value
         update_data["is_edited"] = True
         return await self.update(db, db_obj=db_obj, obj_in=update_data)
 
-    async def increment_view_count(
+    async def get_and_increment_view_count(
         self,
         db: AsyncSession,
         *,
-        db_obj: Discussion,
-    ) -> Discussion:
-        """Increment view count."""
-        db_obj.view_count += 1
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        id: int,
+    ) -> Discussion | None:
+        """Increment view count and return the discussion in a single round-trip."""
+        result = await db.execute(
+            update(Discussion)
+            .where(Discussion.id == id)
+            .values(view_count=Discussion.view_count + 1)
+            .returning(Discussion),
+            execution_options={"populate_existing": True},
+        )
+        return result.scalar_one_or_none()
 
     async def update_reply_count(
         self,
@@ -124,17 +125,16 @@ class CRUDDiscussion(CRUDBase[Discussion]):
         discussion_id: int,
     ) -> None:
         """Update reply count for a discussion."""
-        count_result = await db.execute(
+        reply_count = (
             select(func.count())
             .select_from(DiscussionReply)
             .where(DiscussionReply.discussion_id == discussion_id)
+            .scalar_subquery()
         )
-        count = count_result.scalar() or 0
-
         await db.execute(
             Discussion.__table__.update()
             .where(Discussion.id == discussion_id)
-            .values(reply_count=count)
+            .values(reply_count=reply_count)
         )
 
 
@@ -151,7 +151,7 @@ class CRUDDiscussionReply(CRUDBase[DiscussionReply]):
     ) -> list[DiscussionReply]:
         """Get replies for a discussion."""
         result = await db.execute(
-            select(DiscussionReply)
+            safe_list(select(DiscussionReply))
             .where(DiscussionReply.discussion_id == discussion_id)
             .order_by(DiscussionReply.created_at.asc())
             .offset(offset)
@@ -159,6 +159,23 @@ class CRUDDiscussionReply(CRUDBase[DiscussionReply]):
         )
         return list(result.scalars().all())
 
+    async def iter_by_discussion(
+        self,
+        db: AsyncSession,
+        *,
+        discussion_id: int,
+        batch_size: int = 200,
+    ) -> AsyncIterator[DiscussionReply]:
+        """Stream all replies for a discussion, fetching ``batch_size`` rows at a time."""
+        result = await db.stream_scalars(
+            safe_list(select(DiscussionReply))
+            .where(DiscussionReply.discussion_id == discussion_id)
+            .order_by(DiscussionReply.created_at.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for reply in result:
+            yield reply
+
     async def create_reply(
         self,
         db: AsyncSession,
@@ -168,16 +185,15 @@ class CRUDDiscussionReply(CRUDBase[DiscussionReply]):
         obj_in: DiscussionReplyCreate,
     ) -> DiscussionReply:
         """Create a new reply."""
-        db_obj = DiscussionReply(
-            discussion_id=discussion_id,
-            user_id=user_id,
-            parent_id=obj_in.parent_id,
-            content=obj_in.content,
+        return await self.create(
+            db,
+            obj_in={
+                "discussion_id": discussion_id,
+                "user_id": user_id,
+                "parent_id": obj_in.parent_id,
+                "content": obj_in.content,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def update_reply(
         self,
@@ -185,19 +201,30 @@ class CRUDDiscussionReply(CRUDBase[DiscussionReply]):
         *,
         db_obj: DiscussionReply,
         content: str,
-    ) -> DiscussionReply:
+    ) -> DiscussionReply | None:
         """Update a reply."""
-        db_obj.content = content
-        db_obj.is_edited = True
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        return await self.update_by_id(
+            db, id=db_obj.id, values={"content": content, "is_edited": True}
+        )
 
 
 class CRUDDiscussionLike(CRUDBase[DiscussionLike]):
     """CRUD operations for DiscussionLike model."""
 
+    @staticmethod
+    def _like_conditions(
+        user_id: str,
+        discussion_id: int | None,
+        reply_id: int | None,
+    ) -> list:
+        """Build filter conditions for a like by user and target."""
+        conditions = [DiscussionLike.user_id == user_id]
+        if discussion_id:
+            conditions.append(DiscussionLike.discussion_id == discussion_id)
+        if reply_id:
+            conditions.append(DiscussionLike.reply_id == reply_id)
+        return conditions
+
     async def get_like(
         self,
         db: AsyncSession,
@@ -207,11 +234,7 @@ class CRUDDiscussionLike(CRUDBase[DiscussionLike]):
         reply_id: int | None = None,
     ) -> DiscussionLike | None:
         """Get a like by user and target."""
-        conditions = [DiscussionLike.user_id == user_id]
-        if discussion_id:
-            conditions.append(DiscussionLike.discussion_id == discussion_id)
-        if reply_id:
-            conditions.append(DiscussionLike.reply_id == reply_id)
+        conditions = self._like_conditions(user_id, discussion_id, reply_id)
 
         result = await db.execute(select(DiscussionLike).where(and_(*conditions)))
         return result.scalar_one_or_none()
@@ -225,27 +248,21 @@ class CRUDDiscussionLike(CRUDBase[DiscussionLike]):
         reply_id: int | None = None,
     ) -> bool:
         """Toggle like on a discussion or reply. Returns True if liked, False if unliked."""
-        existing = await self.get_like(
-            db,
-            user_id=user_id,
-            discussion_id=discussion_id,
-            reply_id=reply_id,
+        # Conflicts are detected by the unique (user_id, discussion_id/reply_id) indexes
+        target = DiscussionLike.discussion_id if discussion_id else DiscussionLike.reply_id
+        inserted = await db.execute(
+            pg_insert(DiscussionLike)
+            .values(user_id=user_id, discussion_id=discussion_id, reply_id=reply_id)
+            .on_conflict_do_nothing(index_elements=[DiscussionLike.user_id, target])
+            .returning(DiscussionLike.id)
         )
-
-        if existing:
-            await db.delete(existing)
-            await db.flush()
-            return False
-        else:
-            db_obj = DiscussionLike(
-                user_id=user_id,
-                discussion_id=discussion_id,
-                reply_id=reply_id,
-            )
-            db.add(db_obj)
-            await db.flush()
+        if inserted.scalar_one_or_none() is not None:
             return True
 
+        conditions = self._like_conditions(user_id, discussion_id, reply_id)
+        await db.execute(delete(DiscussionLike).where(and_(*conditions)))
+        return False
+
     async def is_liked(
         self,
         db: AsyncSession,
@@ -255,13 +272,10 @@ class CRUDDiscussionLike(CRUDBase[DiscussionLike]):
         reply_id: int | None = None,
     ) -> bool:
         """Check if user has liked a discussion or reply."""
-        like = await self.get_like(
-            db,
-            user_id=user_id,
-            discussion_id=discussion_id,
-            reply_id=reply_id,
-        )
-        return like is not None
+        conditions = self._like_conditions(user_id, discussion_id, reply_id)
+
+        result = await db.execute(select(exists().where(and_(*conditions))))
+        return bool(result.scalar())
 
 
 discussion = CRUDDiscussion(Discussion)
@@ -1,9 +1,13 @@
 """CRUD operations for neighborhoods."""
 
+import time
+from typing import Any
+
+from sqlalchemy import ColumnElement, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import and_, func, or_, select
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, on_commit, safe_list
 from app.models.neighborhood import Neighborhood
 from app.schemas.neighborhood import NeighborhoodCreate, NeighborhoodQuery, NeighborhoodUpdate
 
@@ -11,13 +15,30 @@ from app.schemas.neighborhood import NeighborhoodCreate, NeighborhoodQuery, Neig
 class CRUDNeighborhood(CRUDBase[Neighborhood]):
     """CRUD operations for Neighborhood model."""
 
-    async def get_multi_with_query(
-        self,
-        db: AsyncSession,
-        *,
-        query: NeighborhoodQuery,
-    ) -> tuple[list[Neighborhood], int]:
-        """Get neighborhoods with filtering and pagination."""
+    LOOKUP_CACHE_TTL = 300  # seconds
+
+    def __init__(self, model: type[Neighborhood]):
+        super().__init__(model)
+        # City/district lookups, keyed by city (None for the city list)
+        self._lookup_cache: dict[str | None, tuple[float, list[str]]] = {}
+
+    def _cached_lookup(self, key: str | None) -> list[str] | None:
+        entry = self._lookup_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def _store_lookup(self, key: str | None, values: list[str]) -> list[str]:
+        self._lookup_cache[key] = (time.monotonic() + self.LOOKUP_CACHE_TTL, values)
+        return values
+
+    def clear_lookup_cache(self) -> None:
+        """Drop cached city/district lists after neighborhoods change."""
+        self._lookup_cache.clear()
+
+    @staticmethod
+    def _build_where(query: NeighborhoodQuery) -> ColumnElement[bool]:
+        """Build the WHERE clause shared by the page and count queries."""
         conditions = []
 
         if query.search:
@@ -36,30 +57,29 @@ class CRUDNeighborhood(CRUDBase[Neighborhood]):
         if query.district:
             conditions.append(Neighborhood.district == query.district)
 
-        where_clause = and_(*conditions) if conditions else True
+        return and_(*conditions) if conditions else true()
+
+    async def get_multi_with_query(
+        self,
+        db: AsyncSession,
+        *,
+        query: NeighborhoodQuery,
+    ) -> tuple[list[Neighborhood], int]:
+        """Get neighborhoods with filtering and pagination."""
+        where_clause = self._build_where(query)
 
         # Order by
         order_by = Neighborhood.name.asc()
         if query.sort_by == "newest":
             order_by = Neighborhood.created_at.desc()
 
-        # Get neighborhoods
-        result = await db.execute(
-            select(Neighborhood)
-            .where(where_clause)
-            .order_by(order_by)
-            .offset(query.offset)
-            .limit(query.limit)
-        )
-        neighborhoods = list(result.scalars().all())
-
-        # Get total count
-        count_result = await db.execute(
-            select(func.count()).select_from(Neighborhood).where(where_clause)
+        return await self.get_page(
+            db,
+            where_clause=where_clause,
+            order_by=order_by,
+            offset=query.offset,
+            limit=query.limit,
         )
-        total = count_result.scalar() or 0
-
-        return neighborhoods, total
 
     async def create_neighborhood(
         self,
@@ -68,16 +88,17 @@ class CRUDNeighborhood(CRUDBase[Neighborhood]):
         obj_in: NeighborhoodCreate,
     ) -> Neighborhood:
         """Create a new neighborhood."""
-        db_obj = Neighborhood(
-            name=obj_in.name,
-            district=obj_in.district,
-            city=obj_in.city,
-            coordinates=obj_in.coordinates.model_dump() if obj_in.coordinates else None,
-            description=obj_in.description,
+        db_obj = await self.create(
+            db,
+            obj_in={
+                "name": obj_in.name,
+                "district": obj_in.district,
+                "city": obj_in.city,
+                "coordinates": obj_in.coordinates.model_dump() if obj_in.coordinates else None,
+                "description": obj_in.description,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
+        on_commit(db, self.clear_lookup_cache)
         return db_obj
 
     async def update_neighborhood(
@@ -88,11 +109,17 @@ class CRUDNeighborhood(CRUDBase[Neighborhood]):
         obj_in: NeighborhoodUpdate,
     ) -> Neighborhood:
         """Update a neighborhood."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         if "coordinates" in update_data and update_data["coordinates"]:
             update_data["coordinates"] = update_data["coordinates"].model_dump()
+        on_commit(db, self.clear_lookup_cache)
         return await self.update(db, db_obj=db_obj, obj_in=update_data)
 
+    async def delete(self, db: AsyncSession, *, id: Any) -> Neighborhood | None:
+        """Delete a neighborhood and drop cached city/district lists."""
+        on_commit(db, self.clear_lookup_cache)
+        return await super().delete(db, id=id)
+
     async def search_by_location(
         self,
         db: AsyncSession,
@@ -102,42 +129,47 @@ class CRUDNeighborhood(CRUDBase[Neighborhood]):
         radius_km: float = 5.0,
     ) -> list[Neighborhood]:
         """Find neighborhoods near a location."""
-        # PostgreSQL Earth distance calculation
+        # Simplified distance in SQL (~111km per degree lat, ~88.8km per degree lng at ~37°N)
         # This is a simplified version - for production, use PostGIS
+        n_lat = Neighborhood.coordinates["lat"].as_float()
+        n_lng = Neighborhood.coordinates["lng"].as_float()
+        lat_diff = (n_lat - lat) * 111
+        lng_diff = (n_lng - lng) * 88.8
+        distance_sq = func.power(lat_diff, 2) + func.power(lng_diff, 2)
+
         result = await db.execute(
-            select(Neighborhood).where(Neighborhood.coordinates.isnot(None)).limit(20)
+            safe_list(select(Neighborhood))
+            .where(
+                Neighborhood.coordinates.isnot(None),
+                # Bounding box first, then the radius check
+                n_lat.between(lat - radius_km / 111, lat + radius_km / 111),
+                n_lng.between(lng - radius_km / 88.8, lng + radius_km / 88.8),
+                distance_sq <= radius_km**2,
+            )
+            .order_by(distance_sq)
         )
-        neighborhoods = list(result.scalars().all())
-
-        # Filter by distance (simplified Haversine approximation)
-        nearby = []
-        for n in neighborhoods:
-            if n.coordinates:
-                n_lat = n.coordinates.get("lat", 0)
-                n_lng = n.coordinates.get("lng", 0)
-                # Simple distance check (not accurate for large distances)
-                lat_diff = abs(n_lat - lat) * 111  # ~111km per degree
-                lng_diff = abs(n_lng - lng) * 88.8  # ~88.8km per degree at ~37°N
-                distance = (lat_diff**2 + lng_diff**2) ** 0.5
-                if distance <= radius_km:
-                    nearby.append(n)
-
-        return nearby
+        return list(result.scalars().all())
 
     async def get_cities(self, db: AsyncSession) -> list[str]:
-        """Get list of unique cities."""
+        """Get list of unique cities (cached for ``LOOKUP_CACHE_TTL`` seconds)."""
+        cached = self._cached_lookup(None)
+        if cached is not None:
+            return cached
         result = await db.execute(select(Neighborhood.city).distinct().order_by(Neighborhood.city))
-        return [row[0] for row in result.all()]
+        return self._store_lookup(None, [row[0] for row in result.all()])
 
     async def get_districts(self, db: AsyncSession, city: str) -> list[str]:
-        """Get list of districts in a city."""
+        """Get list of districts in a city (cached for ``LOOKUP_CACHE_TTL`` seconds)."""
+        cached = self._cached_lookup(city)
+        if cached is not None:
+            return cached
         result = await db.execute(
             select(Neighborhood.district)
             .where(Neighborhood.city == city)
             .distinct()
             .order_by(Neighborhood.district)
         )
-        return [row[0] for row in result.all()]
+        return self._store_lookup(city, [row[0] for row in result.all()])
 
 
 neighborhood = CRUDNeighborhood(Neighborhood)
@@ -1,5 +1,7 @@
 """CRUD operations for notifications."""
 
+from sqlalchemy import ColumnElement
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import and_, func, select
 
@@ -15,14 +17,9 @@ from app.schemas.notification import (
 class CRUDNotification(CRUDBase[Notification]):
     """CRUD operations for Notification model."""
 
-    async def get_user_notifications(
-        self,
-        db: AsyncSession,
-        *,
-        user_id: str,
-        query: NotificationQuery,
-    ) -> tuple[list[Notification], int]:
-        """Get notifications for a user."""
+    @staticmethod
+    def _build_where(user_id: str, query: NotificationQuery) -> ColumnElement[bool]:
+        """Build the WHERE clause shared by the page and count queries."""
         conditions = [Notification.user_id == user_id]
 
         if query.type:
@@ -31,23 +28,25 @@ class CRUDNotification(CRUDBase[Notification]):
         if query.is_read is not None:
             conditions.append(Notification.is_read == query.is_read)
 
-        where_clause = and_(*conditions)
-
-        result = await db.execute(
-            select(Notification)
-            .where(where_clause)
-            .order_by(Notification.created_at.desc())
-            .offset(query.offset)
-            .limit(query.limit)
-        )
-        notifications = list(result.scalars().all())
+        return and_(*conditions)
 
-        count_result = await db.execute(
-            select(func.count()).select_from(Notification).where(where_clause)
+    async def get_user_notifications(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: str,
+        query: NotificationQuery,
+    ) -> tuple[list[Notification], int]:
+        """Get notifications for a user."""
+        where_clause = self._build_where(user_id, query)
+
+        return await self.get_page(
+            db,
+            where_clause=where_clause,
+            order_by=Notification.created_at.desc(),
+            offset=query.offset,
+            limit=query.limit,
         )
-        total = count_result.scalar() or 0
-
-        return notifications, total
 
     async def create_notification(
         self,
@@ -56,31 +55,26 @@ class CRUDNotification(CRUDBase[Notification]):
         obj_in: NotificationCreate,
     ) -> Notification:
         """Create a new notification."""
-        db_obj = Notification(
-            user_id=obj_in.user_id,
-            type=obj_in.type.value,
-            title=obj_in.title,
-            message=obj_in.message,
-            related_id=obj_in.related_id,
-            related_type=obj_in.related_type,
+        return await self.create(
+            db,
+            obj_in={
+                "user_id": obj_in.user_id,
+                "type": obj_in.type.value,
+                "title": obj_in.title,
+                "message": obj_in.message,
+                "related_id": obj_in.related_id,
+                "related_type": obj_in.related_type,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def mark_as_read(
         self,
         db: AsyncSession,
         *,
         db_obj: Notification,
-    ) -> Notification:
+    ) -> Notification | None:
         """Mark a notification as read."""
-        db_obj.is_read = True
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        return await self.update_by_id(db, id=db_obj.id, values={"is_read": True})
 
     async def mark_all_as_read(
         self,
@@ -98,8 +92,9 @@ class CRUDNotification(CRUDBase[Notification]):
                 )
             )
             .values(is_read=True)
+            .returning(Notification.id)
         )
-        return result.rowcount
+        return len(result.all())
 
     async def get_unread_count(
         self,
@@ -143,13 +138,18 @@ class CRUDNotificationSettings(CRUDBase[NotificationSettings]):
         user_id: str,
     ) -> NotificationSettings:
         """Get or create notification settings for a user."""
-        settings = await self.get_by_user(db, user_id=user_id)
-        if not settings:
-            settings = NotificationSettings(user_id=user_id)
-            db.add(settings)
-            await db.flush()
-            await db.refresh(settings)
-        return settings
+        # Single upsert, safe against concurrent first requests for the same user
+        stmt = (
+            pg_insert(NotificationSettings)
+            .values(user_id=user_id)
+            .on_conflict_do_update(
+                index_elements=[NotificationSettings.user_id],
+                set_={"user_id": user_id},
+            )
+            .returning(NotificationSettings)
+        )
+        result = await db.execute(stmt, execution_options={"populate_existing": True})
+        return result.scalar_one()
 
     async def update_settings(
         self,
@@ -159,7 +159,7 @@ class CRUDNotificationSettings(CRUDBase[NotificationSettings]):
         obj_in: NotificationSettingsUpdate,
     ) -> NotificationSettings:
         """Update notification settings."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         return await self.update(db, db_obj=db_obj, obj_in=update_data)
 
 
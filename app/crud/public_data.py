@@ -1,7 +1,11 @@
 """공공데이터 CRUD - PNU 기반 조회 함수들."""
 
 import asyncio
+import json
+import time
+from collections.abc import AsyncIterator
 from datetime import date
+from typing import Any, TypedDict
 
 from geoalchemy2.functions import (
     ST_Contains,
@@ -10,10 +14,11 @@ from geoalchemy2.functions import (
     ST_MakePoint,
     ST_SetSRID,
 )
-from sqlalchemy import desc, func
+from sqlalchemy import Row, Select, and_, desc, func, lambda_stmt, or_, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.database import run_in_session
 from app.models.building import (
     BuildingRegisterArea,
     BuildingRegisterFloorDetail,
@@ -25,55 +30,169 @@ from app.models.enums import PropertyType, TransactionType
 from app.models.lot import Lot
 from app.models.transaction import RealEstateRental, RealEstateSale
 
+
+def _count_of(stmt: Select[Any]) -> Select[tuple[int]]:
+    """같은 FROM/WHERE로 ``SELECT count(*)``를 만듭니다 (서브쿼리로 감싸지 않음)."""
+    return (
+        stmt.with_only_columns(func.count(), maintain_column_froms=True)
+        .order_by(None)
+        .limit(None)
+        .offset(None)
+    )
+
+
+async def _fetch_page(db: AsyncSession, base, *, offset: int, limit: int) -> tuple[list, int]:
+    """페이지와 전체 건수를 한 번의 쿼리로 조회 (COUNT(*) OVER ()).
+
+    빈 페이지에서는 window 결과가 없으므로, offset이 있을 때만 COUNT를 따로 실행합니다.
+    """
+    stmt = base.add_columns(func.count().over().label("total")).offset(offset).limit(limit)
+    rows = (await db.execute(stmt)).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    if offset == 0 and limit > 0:
+        return [], 0
+    return [], (await db.execute(_count_of(base))).scalar() or 0
+
+
+async def _estimated_count(db: AsyncSession, stmt) -> int:
+    """``EXPLAIN (FORMAT JSON)``의 예상 행 수(Plan Rows)로 건수를 근사합니다.
+
+    플래너 통계만 읽으므로 조건에 맞는 행을 실제로 스캔하지 않습니다.
+    """
+    compiled = (
+        stmt.order_by(None).limit(None).offset(None).compile(dialect=db.get_bind().dialect)
+    )
+    # 값은 SQL에 넣지 않고 드라이버 바인드 파라미터로 전달 (asyncpg는 $1.. 위치 인자)
+    params = compiled.params
+    if compiled.positiontup:
+        params = tuple(params[name] for name in compiled.positiontup)
+    conn = await db.connection()
+    plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _fetch_page_estimated(
+    db: AsyncSession, base, *, offset: int, limit: int
+) -> tuple[list, int]:
+    """페이지는 그대로 조회하고 전체 건수는 플래너 추정치로 대신합니다.
+
+    마지막 페이지(limit 미만)에 도달하면 정확한 건수를 알 수 있으므로 그 값을 쓰고,
+    추정치가 이미 읽은 행 수보다 작으면 읽은 행 수로 보정합니다.
+    """
+    items = list((await db.execute(base.offset(offset).limit(limit))).scalars().all())
+    if len(items) < limit and (items or offset == 0):
+        return items, offset + len(items)
+    return items, max(await _estimated_count(db, base), offset + len(items))
+
+
 # ──────────────────────────── 필지(Lot) ────────────────────────────
 
 
 async def get_lot_by_pnu(db: AsyncSession, pnu: str) -> Lot | None:
-    result = await db.execute(select(Lot).where(Lot.pnu == pnu))
-    return result.scalar_one_or_none()
+    # pnu가 PK이므로 identity map을 먼저 확인하고, 없을 때만 SELECT 실행
+    return await db.get(Lot, pnu)
+
+
+# 좌표 → 필지 조회 시 KNN으로 가져올 후보 수
+_POINT_CANDIDATES = 5
 
 
 async def search_lot_by_point(
     db: AsyncSession, lat: float, lng: float
 ) -> Lot | None:
     point = ST_SetSRID(ST_MakePoint(lng, lat), 4326)
-    stmt = select(Lot).where(ST_Contains(Lot.geometry, point)).limit(1)
+    # GiST KNN(<->)로 가까운 후보 몇 개만 인덱스에서 뽑은 뒤 ST_Contains로 확정
+    # (점을 포함하는 필지는 거리 0이므로 항상 후보 안에 들어감)
+    candidates = (
+        select(Lot.pnu)
+        .order_by(Lot.geometry.op("<->")(point))
+        .limit(_POINT_CANDIDATES)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(Lot)
+        .where(Lot.pnu.in_(candidates), ST_Contains(Lot.geometry, point))
+        .limit(1)
+    )
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
 async def search_lots_by_sgg(
-    db: AsyncSession, sgg_code: str, *, offset: int = 0, limit: int = 20
+    db: AsyncSession,
+    sgg_code: str,
+    *,
+    offset: int = 0,
+    limit: int = 20,
+    exact_count: bool = True,
 ) -> tuple[list[Lot], int]:
-    prefix = sgg_code[:5]
-    base = select(Lot).where(Lot.pnu.startswith(prefix))
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = (await db.execute(count_stmt)).scalar() or 0
-    stmt = base.offset(offset).limit(limit)
-    result = await db.execute(stmt)
-    return list(result.scalars().all()), total
+    """시군구코드로 필지를 페이지 조회합니다.
 
+    시군구 하나에 필지가 수십만 건이라 정확한 COUNT는 범위 전체를 읽어야 하므로,
+    ``exact_count=False``면 전체 건수 대신 플래너 추정 건수를 반환합니다.
+    """
+    # PNU 앞 5자리 범위 조건 → PK(btree) 인덱스 범위 스캔 (LIKE 'prefix%'와 달리 collation 무관)
+    prefix = sgg_code[:5]
+    base = select(Lot).where(Lot.pnu >= prefix)
+    if prefix.isdigit() and prefix != "9" * len(prefix):
+        upper = str(int(prefix) + 1).zfill(len(prefix))
+        base = base.where(Lot.pnu < upper)
+    else:
+        base = base.where(Lot.pnu.startswith(prefix))
+    if exact_count:
+        return await _fetch_page(db, base, offset=offset, limit=limit)
+    return await _fetch_page_estimated(db, base, offset=offset, limit=limit)
+
+
+# 필터 옵션은 파이프라인 적재 시에만 바뀌므로 TTL(초) 동안 프로세스 내 캐시
+LOT_FILTER_OPTIONS_TTL = 3600
+# (만료 시각(monotonic), 옵션)
+_lot_filter_options_cache: tuple[float, dict[str, list[str]]] | None = None
+# 캐시 만료 직후 동시 요청이 같은 조회를 중복 실행하지 않도록 직렬화
+_lot_filter_options_lock = asyncio.Lock()
+
+
+# 파이프라인이 lots 적재 후 갱신하는 materialized view (field, value)
+_LOT_FILTER_OPTIONS_SQL = text(
+    "SELECT field, value FROM mv_lot_filter_options ORDER BY field, value"
+)
 
-async def get_lot_filter_options(db: AsyncSession) -> dict[str, list[str]]:
-    """필터 옵션용 고유값 조회 (병렬)."""
-
-    async def _distinct(col):
-        stmt = select(col).where(col.is_not(None)).distinct().order_by(col)
-        result = await db.execute(stmt)
-        return [row[0] for row in result.all()]
 
-    jimok, ownership, use_zone, land_use = await asyncio.gather(
-        _distinct(Lot.jimok),
-        _distinct(Lot.ownership),
-        _distinct(Lot.use_zone),
-        _distinct(Lot.land_use),
-    )
-    return {
-        "jimok": jimok,
-        "ownership": ownership,
-        "use_zone": use_zone,
-        "land_use": land_use,
-    }
+async def get_lot_filter_options() -> dict[str, list[str]]:
+    """필터 옵션용 고유값 조회 (materialized view, ``LOT_FILTER_OPTIONS_TTL`` 캐시).
+
+    lots 전체에 대한 DISTINCT 대신 mv_lot_filter_options를 한 번 읽습니다.
+    파이프라인은 별도 프로세스에서 view만 갱신하므로, 적재 후에도 API 워커는
+    최대 ``LOT_FILTER_OPTIONS_TTL``초 동안 이전 옵션을 반환합니다.
+    """
+    global _lot_filter_options_cache
+    cached = _lot_filter_options_cache
+    if cached is not None and cached[0] >= time.monotonic():
+        return cached[1]
+
+    async with _lot_filter_options_lock:
+        # 대기하는 동안 다른 요청이 채웠을 수 있음
+        cached = _lot_filter_options_cache
+        if cached is not None and cached[0] >= time.monotonic():
+            return cached[1]
+
+        async def _load(db: AsyncSession):
+            result = await db.execute(_LOT_FILTER_OPTIONS_SQL)
+            return result.all()
+
+        options: dict[str, list[str]] = {
+            "jimok": [],
+            "ownership": [],
+            "use_zone": [],
+            "land_use": [],
+        }
+        for field, value in await run_in_session(_load):
+            options[field].append(value)
+        _lot_filter_options_cache = (time.monotonic() + LOT_FILTER_OPTIONS_TTL, options)
+        return options
 
 
 # ──────────────────────────── 건축물 ────────────────────────────
@@ -82,9 +201,11 @@ async def get_lot_filter_options(db: AsyncSession) -> dict[str, list[str]]:
 async def get_building_general(
     db: AsyncSession, pnu: str
 ) -> BuildingRegisterGeneral | None:
+    # PNU당 총괄표제부가 여러 건이면 사용승인일이 가장 최근인 것 하나만 가져옴
     stmt = (
         select(BuildingRegisterGeneral)
         .where(BuildingRegisterGeneral.pnu == pnu)
+        .order_by(BuildingRegisterGeneral.approval_date.desc().nulls_last())
         .limit(1)
     )
     result = await db.execute(stmt)
@@ -131,7 +252,111 @@ async def get_gis_buildings(
     return list(result.scalars().all())
 
 
+# 층별개요/면적 스트리밍 시 한 번에 가져오는 행 수
+_BUILDING_YIELD_PER = 500
+
+
+async def iter_building_floor_details(
+    db: AsyncSession, pnu: str
+) -> AsyncIterator[BuildingRegisterFloorDetail]:
+    """층별개요를 ``_BUILDING_YIELD_PER`` 행씩 스트리밍합니다."""
+    stmt = (
+        select(BuildingRegisterFloorDetail)
+        .where(BuildingRegisterFloorDetail.pnu == pnu)
+        .execution_options(yield_per=_BUILDING_YIELD_PER)
+    )
+    result = await db.stream_scalars(stmt)
+    async for floor in result:
+        yield floor
+
+
+async def iter_building_areas(
+    db: AsyncSession, pnu: str
+) -> AsyncIterator[BuildingRegisterArea]:
+    """전유공용면적을 ``_BUILDING_YIELD_PER`` 행씩 스트리밍합니다 (대단지는 호 단위로 수천 건)."""
+    stmt = (
+        select(BuildingRegisterArea)
+        .where(BuildingRegisterArea.pnu == pnu)
+        .execution_options(yield_per=_BUILDING_YIELD_PER)
+    )
+    result = await db.stream_scalars(stmt)
+    async for area in result:
+        yield area
+
+
+class BuildingBundle(TypedDict):
+    """PNU 하나에 대한 건축물 관련 테이블 조회 결과."""
+
+    general: BuildingRegisterGeneral | None
+    headers: list[BuildingRegisterHeader]
+    floor_details: list[BuildingRegisterFloorDetail]
+    areas: list[BuildingRegisterArea]
+    gis_buildings: list[GisBuildingIntegrated]
+
+
+async def get_building_bundle(pnu: str) -> BuildingBundle:
+    """건축물 관련 테이블을 테이블별 세션에서 동시에 조회합니다."""
+    general, headers, floor_details, areas, gis_buildings = await asyncio.gather(
+        run_in_session(get_building_general, pnu),
+        run_in_session(get_building_headers, pnu),
+        run_in_session(get_building_floor_details, pnu),
+        run_in_session(get_building_areas, pnu),
+        run_in_session(get_gis_buildings, pnu),
+    )
+    return BuildingBundle(
+        general=general,
+        headers=headers,
+        floor_details=floor_details,
+        areas=areas,
+        gis_buildings=gis_buildings,
+    )
+
+
 # ──────────────────────────── 실거래가 ────────────────────────────
+#
+# 고정 형태의 최근 거래 조회는 lambda_stmt로 SELECT 구성 자체를 캐시하고
+# (sgg_code, limit은 바인드 파라미터로 추출), 선택 필터가 붙는 목록 조회는
+# 필터 조합마다 WHERE가 달라지므로 일반 Select로 두고 keyset으로 페이지를 나눕니다.
+
+
+# 실거래가 keyset 커서: 마지막 행의 (계약일, id). 계약일이 없는 행이면 (None, id)
+TransactionCursor = tuple[date | None, int]
+
+
+async def _fetch_seek_page[M: (RealEstateSale, RealEstateRental)](
+    db: AsyncSession,
+    model: type[M],
+    base,
+    *,
+    cursor: TransactionCursor | None,
+    limit: int,
+) -> tuple[list[M], TransactionCursor | None]:
+    """(계약일 DESC NULLS FIRST, id DESC) keyset 페이지와 다음 커서를 조회합니다.
+
+    OFFSET 대신 직전 페이지의 마지막 (계약일, id) 뒤부터 읽으므로 페이지 깊이와
+    무관하게 (sgg_code, transaction_date, id) 인덱스를 역방향으로 범위 스캔합니다.
+    계약일이 없는 행은 기존 DESC 정렬과 같이 맨 앞에 오며, 커서가 그 구간에 있으면
+    남은 NULL 행을 id로 이어 읽은 뒤 계약일이 있는 행으로 넘어갑니다.
+    """
+    stmt = base
+    if cursor:
+        cursor_date, cursor_id = cursor
+        if cursor_date is None:
+            stmt = stmt.where(
+                or_(
+                    and_(model.transaction_date.is_(None), model.id < cursor_id),
+                    model.transaction_date.is_not(None),
+                )
+            )
+        else:
+            stmt = stmt.where(
+                model.transaction_date.is_not(None),
+                tuple_(model.transaction_date, model.id) < tuple_(cursor_date, cursor_id),
+            )
+    stmt = stmt.order_by(model.transaction_date.desc().nulls_first(), model.id.desc()).limit(limit)
+    items = list((await db.execute(stmt)).scalars().all())
+    next_cursor = (items[-1].transaction_date, items[-1].id) if len(items) == limit else None
+    return items, next_cursor
 
 
 async def get_sales(
@@ -141,9 +366,9 @@ async def get_sales(
     property_type: PropertyType | None = None,
     from_date: date | None = None,
     to_date: date | None = None,
-    offset: int = 0,
+    cursor: TransactionCursor | None = None,
     limit: int = 50,
-) -> tuple[list[RealEstateSale], int]:
+) -> tuple[list[RealEstateSale], TransactionCursor | None]:
     base = select(RealEstateSale).where(RealEstateSale.sgg_code == sgg_code)
     if property_type:
         base = base.where(RealEstateSale.property_type == property_type)
@@ -152,12 +377,7 @@ async def get_sales(
     if to_date:
         base = base.where(RealEstateSale.transaction_date <= to_date)
 
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    stmt = base.order_by(desc(RealEstateSale.transaction_date)).offset(offset).limit(limit)
-    result = await db.execute(stmt)
-    return list(result.scalars().all()), total
+    return await _fetch_seek_page(db, RealEstateSale, base, cursor=cursor, limit=limit)
 
 
 async def get_rentals(
@@ -168,9 +388,9 @@ async def get_rentals(
     transaction_type: TransactionType | None = None,
     from_date: date | None = None,
     to_date: date | None = None,
-    offset: int = 0,
+    cursor: TransactionCursor | None = None,
     limit: int = 50,
-) -> tuple[list[RealEstateRental], int]:
+) -> tuple[list[RealEstateRental], TransactionCursor | None]:
     base = select(RealEstateRental).where(RealEstateRental.sgg_code == sgg_code)
     if property_type:
         base = base.where(RealEstateRental.property_type == property_type)
@@ -181,19 +401,14 @@ async def get_rentals(
     if to_date:
         base = base.where(RealEstateRental.transaction_date <= to_date)
 
-    count_stmt = select(func.count()).select_from(base.subquery())
-    total = (await db.execute(count_stmt)).scalar() or 0
-
-    stmt = base.order_by(desc(RealEstateRental.transaction_date)).offset(offset).limit(limit)
-    result = await db.execute(stmt)
-    return list(result.scalars().all()), total
+    return await _fetch_seek_page(db, RealEstateRental, base, cursor=cursor, limit=limit)
 
 
 async def get_recent_sales_by_sgg(
     db: AsyncSession, sgg_code: str, *, limit: int = 5
 ) -> list[RealEstateSale]:
-    stmt = (
-        select(RealEstateSale)
+    stmt = lambda_stmt(
+        lambda: select(RealEstateSale)
         .where(RealEstateSale.sgg_code == sgg_code)
         .order_by(desc(RealEstateSale.transaction_date))
         .limit(limit)
@@ -205,8 +420,8 @@ async def get_recent_sales_by_sgg(
 async def get_recent_rentals_by_sgg(
     db: AsyncSession, sgg_code: str, *, limit: int = 5
 ) -> list[RealEstateRental]:
-    stmt = (
-        select(RealEstateRental)
+    stmt = lambda_stmt(
+        lambda: select(RealEstateRental)
         .where(RealEstateRental.sgg_code == sgg_code)
         .order_by(desc(RealEstateRental.transaction_date))
         .limit(limit)
@@ -217,8 +432,31 @@ async def get_recent_rentals_by_sgg(
 
 # ──────────────────────────── 지도 (bbox) ────────────────────────────
 
+# bbox 조회 시 서버 측 커서에서 한 번에 가져오는 행 수
+_BBOX_YIELD_PER = 200
+
+# 지도 GeoJSON에 필요한 컬럼만 조회 (JSONB 컬럼 등은 제외).
+# geometry는 PostGIS가 GeoJSON 문자열로 직렬화해 Python 측 shapely 변환을 생략
+_MAP_LOT_COLUMNS = (
+    Lot.pnu,
+    Lot.jimok,
+    Lot.area,
+    Lot.use_zone,
+    Lot.land_use,
+    Lot.official_price,
+    Lot.ownership,
+    func.ST_AsGeoJSON(Lot.geometry).label("geometry"),
+)
+_MAP_BUILDING_COLUMNS = (
+    GisBuildingIntegrated.pnu,
+    GisBuildingIntegrated.building_id,
+    GisBuildingIntegrated.building_name,
+    GisBuildingIntegrated.use_name,
+    func.ST_AsGeoJSON(GisBuildingIntegrated.geometry).label("geometry"),
+)
+
 
-async def get_lots_in_bbox(
+async def iter_lots_in_bbox(
     db: AsyncSession,
     min_lng: float,
     min_lat: float,
@@ -234,9 +472,17 @@ async def get_lots_in_bbox(
     use_zone: list[str] | None = None,
     min_official_price: int | None = None,
     max_official_price: int | None = None,
-) -> list[Lot]:
+    precise: bool = False,
+) -> AsyncIterator[Row]:
+    """bbox 내 필지의 지도용 컬럼을 ``_BBOX_YIELD_PER`` 행씩 스트리밍합니다.
+
+    기본은 미리 계산된 bbox 컬럼의 GiST 인덱스만으로 판정하는 겹침(&&) 검사이며,
+    ``precise=True``이면 ST_Intersects로 실제 도형 교차까지 확인합니다.
+    """
     envelope = ST_MakeEnvelope(min_lng, min_lat, max_lng, max_lat, 4326)
-    stmt = select(Lot).where(ST_Intersects(Lot.geometry, envelope))
+    stmt = select(*_MAP_LOT_COLUMNS).where(Lot.bbox.op("&&")(envelope))
+    if precise:
+        stmt = stmt.where(ST_Intersects(Lot.geometry, envelope))
     if jimok:
         stmt = stmt.where(Lot.jimok.in_(jimok))
     if min_area is not None:
@@ -253,12 +499,13 @@ async def get_lots_in_bbox(
         stmt = stmt.where(Lot.official_price >= min_official_price)
     if max_official_price is not None:
         stmt = stmt.where(Lot.official_price <= max_official_price)
-    stmt = stmt.limit(limit)
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    stmt = stmt.limit(limit).execution_options(yield_per=_BBOX_YIELD_PER)
+    result = await db.stream(stmt)
+    async for row in result:
+        yield row
 
 
-async def get_buildings_in_bbox(
+async def iter_buildings_in_bbox(
     db: AsyncSession,
     min_lng: float,
     min_lat: float,
@@ -266,12 +513,19 @@ async def get_buildings_in_bbox(
     max_lat: float,
     *,
     limit: int = 500,
-) -> list[GisBuildingIntegrated]:
+    precise: bool = False,
+) -> AsyncIterator[Row]:
+    """bbox 내 건물의 지도용 컬럼을 ``_BBOX_YIELD_PER`` 행씩 스트리밍합니다.
+
+    판정 방식은 ``iter_lots_in_bbox``와 같습니다.
+    """
     envelope = ST_MakeEnvelope(min_lng, min_lat, max_lng, max_lat, 4326)
-    stmt = (
-        select(GisBuildingIntegrated)
-        .where(ST_Intersects(GisBuildingIntegrated.geometry, envelope))
-        .limit(limit)
+    stmt = select(*_MAP_BUILDING_COLUMNS).where(
+        GisBuildingIntegrated.bbox.op("&&")(envelope)
     )
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    if precise:
+        stmt = stmt.where(ST_Intersects(GisBuildingIntegrated.geometry, envelope))
+    stmt = stmt.limit(limit).execution_options(yield_per=_BBOX_YIELD_PER)
+    result = await db.stream(stmt)
+    async for row in result:
+        yield row
@@ -1,39 +1,69 @@
 """CRUD operations for reports."""
 
-from datetime import datetime
+import time
+from typing import Any
 
+from sqlalchemy import ColumnElement, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import and_, func, or_, select
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, on_commit, safe_list
+from app.models.base import sql_utc_now
 from app.models.report import Report, ReportCategory, ReportReview, ReportStatus
-from app.schemas.report import ReportCreate, ReportQuery, ReportReviewCreate, ReportUpdate
+from app.schemas.report import (
+    ReportCategoryResponse,
+    ReportCreate,
+    ReportQuery,
+    ReportReviewCreate,
+    ReportUpdate,
+)
 
 
 class CRUDReportCategory(CRUDBase[ReportCategory]):
     """CRUD operations for ReportCategory model."""
 
+    ALL_CACHE_TTL = 60  # seconds
+
+    def __init__(self, model: type[ReportCategory]):
+        super().__init__(model)
+        # (expires_at, categories) for get_all(); plain response models, never
+        # ORM instances bound to the session that loaded them
+        self._all_cache: tuple[float, list[ReportCategoryResponse]] | None = None
+
+    def clear_cache(self) -> None:
+        """Drop the cached category list after categories change."""
+        self._all_cache = None
+
     async def get_by_slug(self, db: AsyncSession, slug: str) -> ReportCategory | None:
         """Get category by slug."""
-        result = await db.execute(select(ReportCategory).where(ReportCategory.slug == slug))
-        return result.scalar_one_or_none()
+        return await db.scalar(select(ReportCategory).where(ReportCategory.slug == slug))
+
+    async def get_all(self, db: AsyncSession) -> list[ReportCategoryResponse]:
+        """Get all categories (cached for ``ALL_CACHE_TTL`` seconds)."""
+        if self._all_cache is not None and self._all_cache[0] >= time.monotonic():
+            return self._all_cache[1]
+        result = await db.execute(safe_list(select(ReportCategory)).order_by(ReportCategory.name))
+        categories = [ReportCategoryResponse.model_validate(c) for c in result.scalars()]
+        self._all_cache = (time.monotonic() + self.ALL_CACHE_TTL, categories)
+        return categories
+
+    async def create(self, db: AsyncSession, *, obj_in: dict[str, Any]) -> ReportCategory:
+        """Create a category; the cached list is dropped once it commits."""
+        on_commit(db, self.clear_cache)
+        return await super().create(db, obj_in=obj_in)
 
-    async def get_all(self, db: AsyncSession) -> list[ReportCategory]:
-        """Get all categories."""
-        result = await db.execute(select(ReportCategory).order_by(ReportCategory.name))
-        return list(result.scalars().all())
+    async def delete(self, db: AsyncSession, *, id: Any) -> ReportCategory | None:
+        """Delete a category; the cached list is dropped once it commits."""
+        on_commit(db, self.clear_cache)
+        return await super().delete(db, id=id)
 
 
 class CRUDReport(CRUDBase[Report]):
     """CRUD operations for Report model."""
 
-    async def get_multi_with_query(
-        self,
-        db: AsyncSession,
-        *,
-        query: ReportQuery,
-    ) -> tuple[list[Report], int]:
-        """Get reports with filtering, sorting, and pagination."""
+    @staticmethod
+    def _build_where(query: ReportQuery) -> ColumnElement[bool]:
+        """Build the WHERE clause shared by the page and count queries."""
         conditions = []
 
         if query.search:
@@ -64,7 +94,16 @@ class CRUDReport(CRUDBase[Report]):
         if query.max_price is not None:
             conditions.append(Report.price <= query.max_price)
 
-        where_clause = and_(*conditions) if conditions else True
+        return and_(*conditions) if conditions else true()
+
+    async def get_multi_with_query(
+        self,
+        db: AsyncSession,
+        *,
+        query: ReportQuery,
+    ) -> tuple[list[Report], int]:
+        """Get reports with filtering, sorting, and pagination."""
+        where_clause = self._build_where(query)
 
         # Order by
         order_by = Report.created_at.desc()
@@ -77,23 +116,13 @@ class CRUDReport(CRUDBase[Report]):
         elif query.sort_by == "price_high":
             order_by = Report.price.desc()
 
-        # Get reports
-        result = await db.execute(
-            select(Report)
-            .where(where_clause)
-            .order_by(order_by)
-            .offset(query.offset)
-            .limit(query.limit)
-        )
-        reports = list(result.scalars().all())
-
-        # Get total count
-        count_result = await db.execute(
-            select(func.count()).select_from(Report).where(where_clause)
+        return await self.get_page(
+            db,
+            where_clause=where_clause,
+            order_by=order_by,
+            offset=query.offset,
+            limit=query.limit,
         )
-        total = count_result.scalar() or 0
-
-        return reports, total
 
     async def get_published(
         self,
@@ -103,23 +132,13 @@ class CRUDReport(CRUDBase[Report]):
         limit: int = 20,
     ) -> tuple[list[Report], int]:
         """Get published reports."""
-        where_clause = Report.status == ReportStatus.PUBLISHED.value
-
-        result = await db.execute(
-            select(Report)
-            .where(where_clause)
-            .order_by(Report.published_at.desc())
-            .offset(offset)
-            .limit(limit)
-        )
-        reports = list(result.scalars().all())
-
-        count_result = await db.execute(
-            select(func.count()).select_from(Report).where(where_clause)
+        return await self.get_page(
+            db,
+            where_clause=Report.status == ReportStatus.PUBLISHED.value,
+            order_by=Report.published_at.desc(),
+            offset=offset,
+            limit=limit,
         )
-        total = count_result.scalar() or 0
-
-        return reports, total
 
     async def create_report(
         self,
@@ -129,25 +148,24 @@ class CRUDReport(CRUDBase[Report]):
         obj_in: ReportCreate,
     ) -> Report:
         """Create a new report."""
-        db_obj = Report(
-            author_id=author_id,
-            neighborhood_id=obj_in.neighborhood_id,
-            category_id=obj_in.category_id,
-            title=obj_in.title,
-            subtitle=obj_in.subtitle,
-            cover_image=obj_in.cover_image,
-            summary=obj_in.summary,
-            content=obj_in.content,
-            price=obj_in.price,
-            original_price=obj_in.original_price,
-            tags=obj_in.tags,
-            meta_description=obj_in.meta_description,
-            status=ReportStatus.DRAFT.value,
+        return await self.create(
+            db,
+            obj_in={
+                "author_id": author_id,
+                "neighborhood_id": obj_in.neighborhood_id,
+                "category_id": obj_in.category_id,
+                "title": obj_in.title,
+                "subtitle": obj_in.subtitle,
+                "cover_image": obj_in.cover_image,
+                "summary": obj_in.summary,
+                "content": obj_in.content,
+                "price": obj_in.price,
+                "original_price": obj_in.original_price,
+                "tags": obj_in.tags,
+                "meta_description": obj_in.meta_description,
+                "status": ReportStatus.DRAFT.value,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def update_report(
         self,
@@ -155,43 +173,39 @@ class CRUDReport(CRUDBase[Report]):
         *,
         db_obj: Report,
         obj_in: ReportUpdate,
-    ) -> Report:
+    ) -> Report | None:
         """Update a report."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         if "status" in update_data:
             update_data["status"] = update_data["status"].value
-        update_data["last_updated"] = datetime.utcnow()
-        return await self.update(db, db_obj=db_obj, obj_in=update_data)
+        update_data["last_updated"] = sql_utc_now()
+        return await self.update_by_id(db, id=db_obj.id, values=update_data)
 
-    async def publish(self, db: AsyncSession, *, db_obj: Report) -> Report:
+    async def publish(self, db: AsyncSession, *, db_obj: Report) -> Report | None:
         """Publish a report."""
-        db_obj.status = ReportStatus.PUBLISHED.value
-        db_obj.published_at = datetime.utcnow()
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
-
-    async def archive(self, db: AsyncSession, *, db_obj: Report) -> Report:
+        return await self.update_by_id(
+            db,
+            id=db_obj.id,
+            values={"status": ReportStatus.PUBLISHED.value, "published_at": sql_utc_now()},
+        )
+
+    async def archive(self, db: AsyncSession, *, db_obj: Report) -> Report | None:
         """Archive a report."""
-        db_obj.status = ReportStatus.ARCHIVED.value
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        return await self.update_by_id(
+            db, id=db_obj.id, values={"status": ReportStatus.ARCHIVED.value}
+        )
 
     async def increment_purchase_count(
         self,
         db: AsyncSession,
         *,
         db_obj: Report,
-    ) -> Report:
+    ) -> Report | None:
         """Increment purchase count."""
-        db_obj.purchase_count += 1
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        # Incremented in SQL so concurrent purchases don't overwrite each other
+        return await self.update_by_id(
+            db, id=db_obj.id, values={"purchase_count": Report.purchase_count + 1}
+        )
 
 
 class CRUDReportReview(CRUDBase[ReportReview]):
@@ -206,23 +220,13 @@ class CRUDReportReview(CRUDBase[ReportReview]):
         limit: int = 20,
     ) -> tuple[list[ReportReview], int]:
         """Get reviews for a report."""
-        where_clause = ReportReview.report_id == report_id
-
-        result = await db.execute(
-            select(ReportReview)
-            .where(where_clause)
-            .order_by(ReportReview.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        return await self.get_page(
+            db,
+            where_clause=ReportReview.report_id == report_id,
+            order_by=ReportReview.created_at.desc(),
+            offset=offset,
+            limit=limit,
         )
-        reviews = list(result.scalars().all())
-
-        count_result = await db.execute(
-            select(func.count()).select_from(ReportReview).where(where_clause)
-        )
-        total = count_result.scalar() or 0
-
-        return reviews, total
 
     async def get_user_review(
         self,
@@ -251,16 +255,15 @@ class CRUDReportReview(CRUDBase[ReportReview]):
         obj_in: ReportReviewCreate,
     ) -> ReportReview:
         """Create a new review."""
-        db_obj = ReportReview(
-            report_id=report_id,
-            user_id=user_id,
-            rating=obj_in.rating,
-            content=obj_in.content,
+        return await self.create(
+            db,
+            obj_in={
+                "report_id": report_id,
+                "user_id": user_id,
+                "rating": obj_in.rating,
+                "content": obj_in.content,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
 
 report_category = CRUDReportCategory(ReportCategory)
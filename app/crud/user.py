@@ -1,11 +1,20 @@
 """CRUD operations for users."""
 
+import asyncio
+import base64
+import binascii
+import time
 from datetime import datetime
+from typing import Any
 
+from sqlalchemy import ColumnElement, lambda_stmt, true, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 from sqlmodel import and_, func, or_, select
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, on_commit, safe_list
+from app.database import run_in_session
+from app.models.base import sql_utc_now
 from app.models.user import User
 from app.schemas.user import UserCreate, UserQuery, UserUpdate
 
@@ -13,23 +22,83 @@ from app.schemas.user import UserCreate, UserQuery, UserUpdate
 class CRUDUser(CRUDBase[User]):
     """CRUD operations for User model."""
 
+    COUNT_CACHE_TTL = 60  # seconds
+    COUNT_CACHE_MAX_ENTRIES = 512
+    # Totals below this are cheap to recount and are never cached, so
+    # selective filters always report an exact figure
+    COUNT_CACHE_MIN_TOTAL = 1000
+
+    AUTH_CACHE_TTL = 30  # seconds
+    AUTH_CACHE_MAX_ENTRIES = 8192
+
+    def __init__(self, model: type[User]):
+        super().__init__(model)
+        # filter key -> (expires_at, total) for get_multi_with_query()
+        self._count_cache: dict[tuple[Any, ...], tuple[float, int]] = {}
+        # user id -> (expires_at, column values) for get_cached()
+        self._user_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    def clear_cache(self) -> None:
+        """Drop cached list totals after users are added or change role/status."""
+        self._count_cache.clear()
+
+    @staticmethod
+    def _count_key(query: UserQuery) -> tuple[Any, ...]:
+        return (query.search, query.role, query.is_active, query.provider)
+
+    def _cached_count(self, key: tuple[Any, ...]) -> int | None:
+        entry = self._count_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def _store_count(self, key: tuple[Any, ...], total: int) -> None:
+        if total < self.COUNT_CACHE_MIN_TOTAL:
+            return
+        if len(self._count_cache) >= self.COUNT_CACHE_MAX_ENTRIES:
+            self._count_cache.clear()
+        self._count_cache[key] = (time.monotonic() + self.COUNT_CACHE_TTL, total)
+
+    def _forget_user(self, db: AsyncSession, id: Any) -> None:
+        # Dropped again after commit, so a concurrent lookup cannot re-cache the old row
+        self._user_cache.pop(id, None)
+        on_commit(db, lambda: self._user_cache.pop(id, None))
+
+    async def get_cached(self, db: AsyncSession, id: str) -> User | None:
+        """Get a user by ID, reusing a snapshot for ``AUTH_CACHE_TTL`` seconds.
+
+        Meant for the per-request session lookup. A cached snapshot is merged
+        into ``db`` without a SELECT, so the returned instance belongs to the
+        caller's session and can be updated as usual. Writes through this CRUD
+        drop the snapshot; other workers see changes once it expires.
+        """
+        entry = self._user_cache.get(id)
+        if entry is not None and entry[0] >= time.monotonic():
+            snapshot = User(**entry[1])
+            make_transient_to_detached(snapshot)
+            return await db.merge(snapshot, load=False)
+
+        user = await self.get(db, id)
+        if user is not None:
+            if len(self._user_cache) >= self.AUTH_CACHE_MAX_ENTRIES:
+                self._user_cache.clear()
+            values = {field: getattr(user, field) for field in self._fields}
+            self._user_cache[id] = (time.monotonic() + self.AUTH_CACHE_TTL, values)
+        return user
+
     async def get_by_email(self, db: AsyncSession, email: str) -> User | None:
         """Get user by email."""
-        result = await db.execute(select(User).where(User.email == email))
-        return result.scalar_one_or_none()
+        return await db.scalar(
+            lambda_stmt(lambda: select(User).where(User.email == email).limit(1))
+        )
 
     async def get_by_provider_id(self, db: AsyncSession, provider_id: str) -> User | None:
-        """Get user by OAuth provider ID."""
-        result = await db.execute(select(User).where(User.id == provider_id))
-        return result.scalar_one_or_none()
+        """Get user by OAuth provider ID (primary key; checks the identity map first)."""
+        return await db.get(User, provider_id)
 
-    async def get_multi_with_query(
-        self,
-        db: AsyncSession,
-        *,
-        query: UserQuery,
-    ) -> tuple[list[User], int]:
-        """Get users with filtering, sorting, and pagination."""
+    @staticmethod
+    def _build_where(query: UserQuery) -> ColumnElement[bool]:
+        """Build the WHERE clause shared by the page and count queries."""
         conditions = []
 
         if query.search:
@@ -50,47 +119,157 @@ class CRUDUser(CRUDBase[User]):
         if query.provider:
             conditions.append(User.provider == query.provider.value)
 
-        where_clause = and_(*conditions) if conditions else True
+        return and_(*conditions) if conditions else true()
+
+    @staticmethod
+    def encode_cursor(user: User) -> str:
+        """Build the keyset cursor that resumes the newest-first list after ``user``.
+
+        A user without ``created_at`` gets an empty timestamp part; those rows
+        sort first and are resumed by ``id`` alone.
+        """
+        created_at = user.created_at.isoformat() if user.created_at is not None else ""
+        raw = f"{created_at}|{user.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime | None, str]:
+        """Parse a cursor from ``encode_cursor``; raises ``ValueError`` if malformed."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError("invalid cursor") from e
+        created_at, sep, user_id = raw.partition("|")
+        if not sep or not user_id:
+            raise ValueError("invalid cursor")
+        return (datetime.fromisoformat(created_at) if created_at else None), user_id
+
+    @staticmethod
+    def _after_cursor(created_at: datetime | None, user_id: str) -> ColumnElement[bool]:
+        """Rows that follow ``(created_at, user_id)`` in the newest-first order."""
+        if created_at is None:
+            # Still inside the leading NULL segment: finish it, then every dated row
+            return or_(
+                and_(User.created_at.is_(None), User.id < user_id),
+                User.created_at.is_not(None),
+            )
+        return and_(
+            User.created_at.is_not(None),
+            tuple_(User.created_at, User.id) < tuple_(created_at, user_id),
+        )
+
+    @staticmethod
+    async def _count_where(db: AsyncSession, where_clause: ColumnElement[bool]) -> int:
+        """Count users matching ``where_clause``."""
+        result = await db.execute(select(func.count()).select_from(User).where(where_clause))
+        return result.scalar() or 0
+
+    async def get_multi_with_query(
+        self,
+        db: AsyncSession,
+        *,
+        query: UserQuery,
+    ) -> tuple[list[User], int]:
+        """Get users with filtering, sorting, and pagination.
+
+        With ``query.cursor`` the newest-first list is read by keyset: rows
+        after the cursor's ``(created_at, id)`` are seeked on the
+        ``(created_at, id)`` index instead of skipping ``offset`` rows.
 
-        # Order by
-        order_by = User.created_at.desc()
+        Totals of at least ``COUNT_CACHE_MIN_TOTAL`` rows are cached per filter
+        for ``COUNT_CACHE_TTL`` seconds, so later pages skip the count.
+        """
+        where_clause = self._build_where(query)
+        count_key = self._count_key(query)
+        total = self._cached_count(count_key)
+
+        # Newest first; rows without created_at lead, as in PostgreSQL's DESC default
+        newest_first = (User.created_at.desc().nulls_first(), User.id.desc())
+
+        if query.cursor:
+            created_at, user_id = self.decode_cursor(query.cursor)
+            stmt = (
+                safe_list(select(User))
+                .where(where_clause, self._after_cursor(created_at, user_id))
+                .order_by(*newest_first)
+                .limit(query.limit)
+            )
+            if total is not None:
+                return list((await db.execute(stmt)).scalars().all()), total
+            # The count runs on its own pooled session so it overlaps the page query
+            result, total = await asyncio.gather(
+                db.execute(stmt), run_in_session(self._count_where, where_clause)
+            )
+            self._store_count(count_key, total)
+            return list(result.scalars().all()), total
+
+        # Order by (id breaks ties so the newest-first order matches the keyset)
+        order_by = newest_first
         if query.sort_by == "oldest":
             order_by = User.created_at.asc()
         elif query.sort_by == "name":
             order_by = User.name.asc()
 
-        # Get users
-        result = await db.execute(
-            select(User)
-            .where(where_clause)
-            .order_by(order_by)
-            .offset(query.offset)
-            .limit(query.limit)
+        if total is not None:
+            # Cached total: plain page query without the COUNT(*) OVER () scan
+            order = order_by if isinstance(order_by, tuple) else (order_by,)
+            stmt = (
+                safe_list(select(User))
+                .where(where_clause)
+                .order_by(*order)
+                .offset(query.offset)
+                .limit(query.limit)
+            )
+            return list((await db.execute(stmt)).scalars().all()), total
+
+        users, total = await self.get_page(
+            db,
+            where_clause=where_clause,
+            order_by=order_by,
+            offset=query.offset,
+            limit=query.limit,
         )
-        users = list(result.scalars().all())
+        self._store_count(count_key, total)
+        return users, total
 
-        # Get total count
-        count_result = await db.execute(select(func.count()).select_from(User).where(where_clause))
-        total = count_result.scalar() or 0
+    async def create(self, db: AsyncSession, *, obj_in: dict[str, Any]) -> User:
+        """Create a user and drop the cached list totals."""
+        on_commit(db, self.clear_cache)
+        return await super().create(db, obj_in=obj_in)
 
-        return users, total
+    async def delete(self, db: AsyncSession, *, id: Any) -> User | None:
+        """Delete a user and drop the cached list totals."""
+        on_commit(db, self.clear_cache)
+        self._forget_user(db, id)
+        return await super().delete(db, id=id)
+
+    async def update(self, db: AsyncSession, *, db_obj: User, obj_in: dict[str, Any]) -> User:
+        """Update a user and drop its cached snapshot."""
+        self._forget_user(db, db_obj.id)
+        return await super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    async def update_by_id(
+        self, db: AsyncSession, *, id: Any, values: dict[str, Any]
+    ) -> User | None:
+        """Update a user with ``UPDATE ... RETURNING`` and drop its cached snapshot."""
+        self._forget_user(db, id)
+        return await super().update_by_id(db, id=id, values=values)
 
     async def create_user(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
         """Create a new user."""
-        db_obj = User(
-            id=f"{obj_in.provider.value}:{obj_in.email}",  # Generate OAuth-style ID
-            email=obj_in.email,
-            name=obj_in.name,
-            profile_image_url=obj_in.profile_image_url,
-            role=obj_in.role.value,
-            provider=obj_in.provider.value,
-            phone=obj_in.phone,
-            is_active=True,
+        return await self.create(
+            db,
+            obj_in={
+                "id": f"{obj_in.provider.value}:{obj_in.email}",  # Generate OAuth-style ID
+                "email": obj_in.email,
+                "name": obj_in.name,
+                "profile_image_url": obj_in.profile_image_url,
+                "role": obj_in.role.value,
+                "provider": obj_in.provider.value,
+                "phone": obj_in.phone,
+                "is_active": True,
+            },
         )
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
 
     async def update_user(
         self,
@@ -100,40 +279,27 @@ class CRUDUser(CRUDBase[User]):
         obj_in: UserUpdate,
     ) -> User:
         """Update user profile."""
-        update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = {field: getattr(obj_in, field) for field in obj_in.model_fields_set}
         return await self.update(db, db_obj=db_obj, obj_in=update_data)
 
-    async def update_role(self, db: AsyncSession, *, db_obj: User, role: str) -> User:
+    async def update_role(self, db: AsyncSession, *, db_obj: User, role: str) -> User | None:
         """Update user role."""
-        db_obj.role = role
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        on_commit(db, self.clear_cache)
+        return await self.update_by_id(db, id=db_obj.id, values={"role": role})
 
-    async def deactivate(self, db: AsyncSession, *, db_obj: User) -> User:
+    async def deactivate(self, db: AsyncSession, *, db_obj: User) -> User | None:
         """Deactivate a user."""
-        db_obj.is_active = False
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        on_commit(db, self.clear_cache)
+        return await self.update_by_id(db, id=db_obj.id, values={"is_active": False})
 
-    async def activate(self, db: AsyncSession, *, db_obj: User) -> User:
+    async def activate(self, db: AsyncSession, *, db_obj: User) -> User | None:
         """Activate a user."""
-        db_obj.is_active = True
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        on_commit(db, self.clear_cache)
+        return await self.update_by_id(db, id=db_obj.id, values={"is_active": True})
 
-    async def update_last_login(self, db: AsyncSession, *, db_obj: User) -> User:
+    async def update_last_login(self, db: AsyncSession, *, db_obj: User) -> User | None:
         """Update last login timestamp."""
-        db_obj.last_login_at = datetime.utcnow()
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
-        return db_obj
+        return await self.update_by_id(db, id=db_obj.id, values={"last_login_at": sql_utc_now()})
 
 
 user = CRUDUser(User)
@@ -10,12 +10,14 @@ from starlette.middleware.sessions import SessionMiddleware
 from app.api.v1 import router as api_v1_router
 from app.auth.oauth import oauth_router
 from app.config import settings
+from app.database import warm_up_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler for startup and shutdown events."""
     # Startup
+    await warm_up_pool()
     yield
     # Shutdown
 
@@ -4,7 +4,8 @@ from datetime import UTC, datetime
 from typing import Any
 
 from geoalchemy2 import Geometry as GeoAlchemyGeometry
-from sqlalchemy import Column
+from sqlalchemy import Column, Computed, func
+from sqlalchemy.sql.elements import ColumnElement
 from sqlmodel import Field, SQLModel
 
 
@@ -13,6 +14,11 @@ def get_utc_now() -> datetime:
     return datetime.now(UTC).replace(tzinfo=None)
 
 
+def sql_utc_now() -> ColumnElement[datetime]:
+    """SQL expression for the current UTC time (naive), evaluated by the database."""
+    return func.timezone("UTC", func.now())
+
+
 def geometry_column(
     geometry_type: str = "GEOMETRY",
     srid: int = 4326,
@@ -41,6 +47,31 @@ def geometry_column(
     )
 
 
+def envelope_column(
+    source: str = "geometry",
+    description: str = "geometry의 bbox (ST_Envelope, 자동 계산)",
+) -> Any:
+    """``source`` 컬럼의 bbox를 저장하는 generated geometry 컬럼 필드를 생성합니다.
+
+    DB가 쓰기 시점에 ST_Envelope로 계산해 저장(STORED)하므로 직접 쓰지 않습니다.
+    bbox 겹침(&&) 조회 시 원본 다각형 대신 이 컬럼을 사용하면
+    인덱스 재확인 단계에서 큰 geometry를 읽지 않아도 됩니다.
+    """
+    return Field(
+        default=None,
+        sa_column=Column(
+            GeoAlchemyGeometry(
+                geometry_type="GEOMETRY",
+                srid=4326,
+                spatial_index=True,
+            ),
+            Computed(f"ST_Envelope({source})", persisted=True),
+            nullable=True,
+        ),
+        description=description,
+    )
+
+
 class TimestampMixin(SQLModel):
     """Mixin for adding created_at and updated_at timestamps."""
 
@@ -5,7 +5,7 @@ from typing import Any
 from sqlalchemy import UniqueConstraint
 from sqlmodel import Field
 
-from app.models.base import PublicDataBase, geometry_column
+from app.models.base import PublicDataBase, envelope_column, geometry_column
 
 
 class BuildingRegisterHeader(PublicDataBase, table=True):
@@ -155,3 +155,4 @@ class GisBuildingIntegrated(PublicDataBase, table=True):
     above_ground_floors: int | None = Field(default=None, description="지상층수")
     underground_floors: int | None = Field(default=None, description="지하층수")
     geometry: Any = geometry_column(description="건물 경계 (Polygon/MultiPolygon)")
+    bbox: Any = envelope_column()
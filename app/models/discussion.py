@@ -2,6 +2,7 @@
 
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import Field
 
 from app.models.base import TimestampMixin
@@ -21,6 +22,23 @@ class Discussion(TimestampMixin, table=True):
     """Community discussion post model."""
 
     __tablename__ = "discussions"
+    __table_args__ = (
+        Index("ix_discussions_neighborhood_id_created_at", "neighborhood_id", "created_at"),
+        Index("ix_discussions_like_count", "like_count"),
+        # Trigram indexes for ILIKE '%...%' search (requires pg_trgm)
+        Index(
+            "ix_discussions_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_discussions_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", max_length=255, ondelete="CASCADE")
@@ -61,6 +79,10 @@ class DiscussionLike(TimestampMixin, table=True):
     """Like on a discussion or reply."""
 
     __tablename__ = "discussion_likes"
+    __table_args__ = (
+        Index("uq_discussion_likes_user_discussion", "user_id", "discussion_id", unique=True),
+        Index("uq_discussion_likes_user_reply", "user_id", "reply_id", unique=True),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", max_length=255, ondelete="CASCADE")
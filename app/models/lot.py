@@ -18,7 +18,7 @@ from sqlalchemy import BigInteger, Column
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, SQLModel
 
-from app.models.base import geometry_column, get_utc_now
+from app.models.base import envelope_column, geometry_column, get_utc_now
 
 
 # pnu 가 primary_key 여서 SQLModel 상속
@@ -38,6 +38,7 @@ class Lot(SQLModel, table=True):
     )
     address: str | None = Field(default=None, max_length=200, description="전체 주소")
     geometry: Any = geometry_column(description="필지 경계 (Polygon/MultiPolygon)")
+    bbox: Any = envelope_column()
     created_at: datetime | None = Field(default_factory=get_utc_now)
 
     # ── flat 컬럼 (1:1 from 토지특성/토지임야) ──
@@ -2,6 +2,7 @@
 
 from enum import Enum
 
+from sqlalchemy import Index, text
 from sqlmodel import Field
 
 from app.models.base import TimestampMixin
@@ -22,6 +23,15 @@ class Notification(TimestampMixin, table=True):
     """User notification model."""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_notifications_user_id_unread",
+            "user_id",
+            "created_at",
+            postgresql_where=text("is_read = false"),
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     user_id: str = Field(foreign_key="users.id", max_length=255, ondelete="CASCADE")
@@ -4,7 +4,7 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index, text
 from sqlalchemy.dialects.postgresql import JSON
 from sqlmodel import Field
 
@@ -34,6 +34,33 @@ class Report(TimestampMixin, table=True):
     """Neighborhood report/content model."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        # Published list ordered by publish date
+        Index(
+            "ix_reports_published_at_published",
+            text("published_at DESC"),
+            postgresql_where=text("status = 'published'"),
+        ),
+        # Trigram indexes for ILIKE '%...%' search (requires pg_trgm)
+        Index(
+            "ix_reports_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_reports_subtitle_trgm",
+            "subtitle",
+            postgresql_using="gin",
+            postgresql_ops={"subtitle": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_reports_summary_trgm",
+            "summary",
+            postgresql_using="gin",
+            postgresql_ops={"summary": "gin_trgm_ops"},
+        ),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     author_id: str = Field(foreign_key="users.id", max_length=255, ondelete="CASCADE")
@@ -18,7 +18,8 @@ class RealEstateSale(PublicDataBase, table=True):
 
     __tablename__ = "real_estate_sales"
     __table_args__ = (
-        Index("ix_sales_sgg_txdate", "sgg_code", "transaction_date"),
+        # (계약일, id) keyset 페이지네이션용
+        Index("ix_sales_sgg_txdate_id", "sgg_code", "transaction_date", "id"),
     )
 
     # ── 핵심 식별 필드 ──
@@ -74,7 +75,8 @@ class RealEstateRental(PublicDataBase, table=True):
 
     __tablename__ = "real_estate_rentals"
     __table_args__ = (
-        Index("ix_rentals_sgg_txdate", "sgg_code", "transaction_date"),
+        # (계약일, id) keyset 페이지네이션용
+        Index("ix_rentals_sgg_txdate_id", "sgg_code", "transaction_date", "id"),
     )
 
     # ── 핵심 식별 필드 ──
@@ -3,6 +3,7 @@
 from datetime import datetime
 from enum import Enum
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from app.models.base import TimestampMixin
@@ -27,6 +28,23 @@ class User(TimestampMixin, table=True):
     """User model for OAuth authentication."""
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination for the newest-first admin user list
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Trigram indexes for the admin ILIKE '%...%' search (requires pg_trgm)
+        Index(
+            "ix_users_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_users_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+    )
 
     id: str = Field(primary_key=True, max_length=255)  # OAuth ID like "kakao:12345"
     email: str = Field(unique=True, max_length=255, index=True)
@@ -78,6 +78,8 @@ class DbManager:
         self.environments = {
             name: DbConfig.from_url(url) for name, url in environments.items()
         }
+        # Docker 실행 여부는 세션 동안 한 번만 확인 (명령마다 docker inspect 방지)
+        self._docker_status: dict[str, bool] = {}
 
     def get_config(self, env: str) -> DbConfig:
         if env not in self.environments:
@@ -88,14 +90,18 @@ class DbManager:
         """localhost DB가 Docker 컨테이너에서 실행 중이면 True를 반환합니다."""
         if config.host not in ("localhost", "127.0.0.1"):
             return False
+        if DOCKER_CONTAINER in self._docker_status:
+            return self._docker_status[DOCKER_CONTAINER]
         try:
             result = subprocess.run(
                 ["docker", "inspect", "-f", "{{.State.Running}}", DOCKER_CONTAINER],
                 capture_output=True, text=True, check=False,
             )
-            return result.returncode == 0 and "true" in result.stdout.strip()
+            running = result.returncode == 0 and "true" in result.stdout.strip()
         except FileNotFoundError:
-            return False
+            running = False
+        self._docker_status[DOCKER_CONTAINER] = running
+        return running
 
     def list_environments(self) -> None:
         """등록된 환경 목록을 출력합니다."""
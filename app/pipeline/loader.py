@@ -7,7 +7,7 @@
 import json
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel
 
@@ -103,18 +103,32 @@ def _build_val_expr(col: str, *, simplify_tolerance: float | None = None) -> str
 
     geometry 컬럼은 WKT 문자열을 PostGIS Geometry로 변환합니다.
     simplify_tolerance가 지정되면 ST_Simplify로 좌표를 단순화합니다.
+    허용 오차는 SQL에 직접 넣지 않고 :simplify_tolerance 파라미터로 바인딩합니다
+    (_sql_with_tolerance 참고).
     JSONB 컬럼은 ::jsonb 캐스팅을 추가합니다.
     """
     if col == "geometry":
         expr = f"ST_GeomFromText(:{col}, 4326)"
         if simplify_tolerance is not None:
-            expr = f"ST_Simplify({expr}, {simplify_tolerance})"
+            expr = f"ST_Simplify({expr}, :simplify_tolerance)"
         return expr
     if col in JSONB_COLUMNS:
         return f"CAST(:{col} AS jsonb)"
     return f":{col}"
 
 
+def _sql_with_tolerance(sql: str, simplify_tolerance: float | None) -> TextClause:
+    """SQL 문자열을 text()로 감싸고, 허용 오차가 있으면 바인드 값으로 지정합니다.
+
+    값이 SQL 문자열에 들어가지 않으므로 허용 오차와 무관하게 같은 문장이
+    재사용되어 asyncpg prepared statement 캐시에 그대로 적중합니다.
+    """
+    stmt = text(sql)
+    if simplify_tolerance is not None and ":simplify_tolerance" in sql:
+        stmt = stmt.bindparams(simplify_tolerance=simplify_tolerance)
+    return stmt
+
+
 def _serialize_records(records: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """레코드를 DB 삽입에 맞게 전처리합니다.
 
@@ -164,7 +178,10 @@ async def bulk_insert(
         )
 
         await session.execute(
-            text(f'INSERT INTO "{table_name}" ({col_str}) VALUES ({val_str})'),  # noqa: S608
+            _sql_with_tolerance(
+                f'INSERT INTO "{table_name}" ({col_str}) VALUES ({val_str})',  # noqa: S608
+                simplify_tolerance,
+            ),
             batch,
         )
         total += len(batch)
@@ -231,7 +248,9 @@ async def bulk_upsert(
                 f"ON CONFLICT ({conflict_str}) DO NOTHING"
             )
 
-        result = await session.execute(text(sql), batch)  # noqa: S608
+        result = await session.execute(
+            _sql_with_tolerance(sql, simplify_tolerance), batch  # noqa: S608
+        )
         row_count = result.rowcount if result.rowcount and result.rowcount > 0 else 0
         inserted += row_count
 
@@ -269,3 +288,12 @@ async def populate_lot_addresses(session: AsyncSession) -> int:
     result = await session.execute(_POPULATE_ADDRESS_SQL)
     await session.commit()
     return result.rowcount or 0
+
+
+# ── 필지 필터 옵션 (materialized view) ──
+
+
+async def refresh_lot_filter_options(session: AsyncSession) -> None:
+    """lots 적재 후 mv_lot_filter_options를 갱신합니다 (조회를 막지 않는 CONCURRENTLY)."""
+    await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_lot_filter_options"))
+    await session.commit()
@@ -8,15 +8,6 @@ from typing import Any
 from app.models.enums import PublicDataType
 from app.pipeline.parsing import safe_float, safe_int
 
-# 모듈 레벨 PNU 캐시 (한 세션 내에서 재사용)
-_valid_pnu_cache: set[str] | None = None
-
-
-def invalidate_pnu_cache() -> None:
-    """PNU 캐시를 무효화합니다. 연속지적도 적재 후 호출하세요."""
-    global _valid_pnu_cache
-    _valid_pnu_cache = None
-
 
 @dataclass
 class ProcessResult:
@@ -117,12 +108,15 @@ class BaseProcessor(ABC):
         # PNU 검증: lots 테이블(연속지적도)에 존재하는 PNU만 적재
         skipped = 0
         if self.pnu_field and records:
-            valid_pnus = await self._load_valid_pnus()
+            candidates = {
+                pnu for r in records if (pnu := r.get(self.pnu_field)) is not None
+            }
+            valid_pnus = await self._load_valid_pnus(candidates)
             if not valid_pnus:
                 from app.pipeline import console
 
                 console.print(
-                    "[red bold]  ⚠ lots 테이블에 데이터가 없습니다. "
+                    "[red bold]  ⚠ lots 테이블에 일치하는 PNU가 없습니다. "
                     "연속지적도를 먼저 적재해주세요.[/]"
                 )
                 return ProcessResult(collected=len(raw), skipped=len(records))
@@ -141,27 +135,48 @@ class BaseProcessor(ABC):
         result = await self.load(records)
         result.collected = len(raw)
         result.skipped += skipped
+
+        if result.inserted > 0:
+            await self._refresh_derived_views()
         return result
 
+    async def _refresh_derived_views(self) -> None:
+        """적재한 테이블에서 파생된 materialized view를 갱신합니다."""
+        from app.pipeline.loader import get_table_name
+
+        if get_table_name(self.data_type) != "lots":
+            return
+
+        from app.database import async_session_maker
+        from app.pipeline.loader import refresh_lot_filter_options
+
+        async with async_session_maker() as session:
+            await refresh_lot_filter_options(session)
+
     @staticmethod
-    async def _load_valid_pnus() -> set[str]:
-        """lots 테이블에서 유효한 PNU 집합을 로드합니다 (캐시 사용)."""
-        global _valid_pnu_cache
-        if _valid_pnu_cache is not None:
-            return _valid_pnu_cache
+    async def _load_valid_pnus(candidates: set[str]) -> set[str]:
+        """후보 PNU 중 lots 테이블에 존재하는 것만 반환합니다.
 
-        from sqlalchemy import text
+        lots 전체를 읽는 대신 후보 목록을 배열 파라미터 하나로 보내
+        unnest() 결과와 lots를 조인하므로, 후보 수와 무관하게 한 번의 쿼리로 끝납니다.
+        """
+        if not candidates:
+            return set()
+
+        from sqlalchemy import bindparam, text
+        from sqlalchemy.dialects.postgresql import ARRAY
+        from sqlalchemy.types import String
 
         from app.database import async_session_maker
         from app.pipeline import console
 
-        console.print("  [dim]연속지적도 PNU 목록 로딩 중...[/]")
+        console.print(f"  [dim]연속지적도 PNU 검증 중 ({len(candidates):,}건)...[/]")
+        stmt = text(
+            "SELECT l.pnu FROM unnest(:pnus) AS p(pnu) JOIN lots l ON l.pnu = p.pnu"
+        ).bindparams(bindparam("pnus", type_=ARRAY(String)))
         async with async_session_maker() as session:
-            rows = await session.execute(text("SELECT pnu FROM lots"))
-            _valid_pnu_cache = {row[0] for row in rows}
-
-        console.print(f"  [dim]유효 PNU: {len(_valid_pnu_cache):,}건 로드[/]")
-        return _valid_pnu_cache
+            rows = await session.execute(stmt, {"pnus": list(candidates)})
+            return {row[0] for row in rows}
 
     async def load(self, records: list[dict[str, Any]]) -> ProcessResult:
         """변환된 데이터를 DB에 적재합니다.
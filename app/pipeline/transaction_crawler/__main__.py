@@ -40,7 +40,7 @@ def parse_date(s: str) -> date:
         raise argparse.ArgumentTypeError(f"날짜 형식이 올바르지 않습니다: {s} (YYYY-MM-DD)")
 
 
-def main() -> None:
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="국토교통부 실거래가 엑셀 데이터 크롤러",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -81,8 +81,14 @@ def main() -> None:
         action="store_true",
         help="테스트 모드 (아파트 매매 최근 1개월만)",
     )
+    return parser
 
-    args = parser.parse_args()
+
+_PARSER = _build_parser()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _PARSER.parse_args(argv)
 
     if args.test:
         today = date.today()
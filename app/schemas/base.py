@@ -1,5 +1,6 @@
 """Base schemas and utilities."""
 
+import json
 from datetime import datetime
 from typing import Annotated, Any
 
@@ -12,6 +13,7 @@ def wkb_to_geojson(value: Any) -> dict[str, Any] | None:
 
     PostGIS Geometry 컬럼에서 읽은 WKBElement를
     API 응답용 GeoJSON dict로 변환합니다.
+    ST_AsGeoJSON으로 DB에서 이미 직렬화한 문자열도 그대로 파싱합니다.
 
     사용 예:
         geojson = wkb_to_geojson(row.geometry)
@@ -21,6 +23,8 @@ def wkb_to_geojson(value: Any) -> dict[str, Any] | None:
         return None
     if isinstance(value, dict):
         return value
+    if isinstance(value, str):
+        return json.loads(value)
 
     from geoalchemy2.elements import WKBElement
     from geoalchemy2.shape import to_shape
@@ -93,6 +97,7 @@ class PaginationMeta(BaseSchema):
     limit: int
     total: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class PaginatedResponse[T](BaseSchema):
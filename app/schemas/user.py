@@ -55,6 +55,7 @@ class UserQuery(PaginationParams):
     is_active: bool | None = None
     provider: AuthProvider | None = None
     sort_by: str = "newest"  # newest, oldest, name
+    cursor: str | None = None  # next_cursor from the previous page (newest only)
 
 
 # === Response Schemas ===
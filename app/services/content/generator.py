@@ -11,6 +11,8 @@ from app.services.content.scraper import RealEstateScraper
 class ContentGenerator:
     """Service for generating real estate content."""
 
+    __slots__ = ("workflow", "scraper")
+
     def __init__(self):
         self.workflow = ContentGenerationWorkflow()
         self.scraper = RealEstateScraper()
@@ -0,0 +1,71 @@
+"""CRUD 테스트용 인메모리 SQLite 세션.
+
+aiosqlite 없이 동기 ``Session``을 ``AsyncSession``처럼 await 할 수 있게 감쌉니다.
+"""
+
+import inspect
+from contextlib import nullcontext
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+try:
+    from sqlmodel.sql.sqltypes import UTCDateTime
+except ImportError:  # 이전 sqlmodel은 naive datetime을 그대로 바인딩
+    UTCDateTime = None
+
+# await 없이 호출되는 AsyncSession 메서드
+_SYNC_METHODS = {"add", "add_all", "expunge", "expunge_all", "get_bind", "in_transaction", "is_modified"}
+
+NOW = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class AsyncSessionShim:
+    """동기 Session의 메서드를 코루틴으로 노출하는 얇은 래퍼."""
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+
+    def __getattr__(self, name: str):
+        attr = getattr(self.sync_session, name)
+        if name in _SYNC_METHODS or not inspect.ismethod(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            return attr(*args, **kwargs)
+
+        return call
+
+    def __contains__(self, instance) -> bool:
+        return instance in self.sync_session
+
+
+def allow_naive_datetimes():
+    """모델 기본값(``get_utc_now``, naive UTC)을 UTC로 간주해 바인딩합니다.
+
+    최신 sqlmodel은 timezone 없는 datetime 바인딩을 거부하므로 테스트에서만 보정합니다.
+    """
+    if UTCDateTime is None:
+        return nullcontext()
+    original = UTCDateTime.process_bind_param
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return original(self, value, dialect)
+
+    return patch.object(UTCDateTime, "process_bind_param", process_bind_param)
+
+
+def make_session(*tables) -> AsyncSessionShim:
+    """주어진 테이블만 생성한 인메모리 DB 세션을 반환합니다."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    for table in tables:
+        table.create(engine)
+    # 앱 세션과 동일하게 autoflush 없이 동작
+    return AsyncSessionShim(Session(engine, expire_on_commit=False, autoflush=False))
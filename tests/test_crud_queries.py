@@ -0,0 +1,226 @@
+"""CRUD 쿼리 헬퍼 테스트 (인메모리 SQLite)."""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import update
+
+from app.crud import user as user_module
+from app.crud.discussion import discussion_like
+from app.crud.user import user as user_crud
+from app.models.discussion import DiscussionLike
+from app.models.user import User
+from app.schemas.user import UserQuery
+from tests.sqlite_session import NOW, allow_naive_datetimes, make_session
+
+
+def _user(n: int, created_at=NOW) -> User:
+    return User(
+        id=f"local:{n:02d}",
+        email=f"user{n}@example.com",
+        name=f"user{n}",
+        provider="local",
+        created_at=created_at,
+        updated_at=NOW,
+    )
+
+
+class TestCreate(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.enterContext(allow_naive_datetimes())
+        self.db = make_session(User.__table__, DiscussionLike.__table__)
+
+    async def test_defaults_come_back_from_returning(self):
+        before = datetime.now(UTC)
+        created = await user_crud.create(
+            self.db,
+            obj_in={"id": "local:01", "email": "a@example.com", "name": "a", "provider": "local"},
+        )
+
+        self.assertEqual(created.id, "local:01")
+        self.assertIs(created.is_active, True)
+        self.assertEqual(created.role, "user")
+        self.assertIsNone(created.phone)
+        # default_factory가 컬럼 기본값으로 INSERT 시점에 채워짐
+        for stamp in (created.created_at, created.updated_at):
+            self.assertIsNotNone(stamp)
+            self.assertLess(abs(stamp - before), timedelta(minutes=1))
+        self.assertIs(await self.db.get(User, "local:01"), created)
+
+    async def test_autoincrement_pk_is_returned(self):
+        first = await discussion_like.create(self.db, obj_in={"user_id": "local:01", "discussion_id": 1})
+        second = await discussion_like.create(self.db, obj_in={"user_id": "local:01", "reply_id": 1})
+
+        self.assertIsInstance(first.id, int)
+        self.assertEqual(second.id, first.id + 1)
+        self.assertIsNotNone(first.created_at)
+        self.assertIsNone(first.reply_id)
+
+
+class TestUserKeysetCursor(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = make_session(User.__table__)
+        # 같은 시각 행(동률), created_at이 없는 행을 섞어 둠
+        stamps = [NOW, NOW, NOW - timedelta(days=1), None, NOW + timedelta(days=1), None, NOW]
+        self.db.add_all(_user(n, created_at or NOW) for n, created_at in enumerate(stamps))
+        await self.db.flush()
+        # None이면 ORM이 컬럼 기본값을 쓰므로 NULL은 UPDATE로 넣음
+        await self.db.execute(
+            update(User).where(User.id.in_(["local:03", "local:05"])).values(created_at=None)
+        )
+        await self.db.commit()
+        self.db.expunge_all()
+
+        async def run_in_session(fn, *args, **kwargs):
+            return await fn(self.db, *args, **kwargs)
+
+        patcher = patch.object(user_module, "run_in_session", run_in_session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _walk(self, limit: int) -> list[str]:
+        users, _ = await user_crud.get_multi_with_query(self.db, query=UserQuery(limit=limit))
+        ids = [u.id for u in users]
+        while len(users) == limit:
+            cursor = user_crud.encode_cursor(users[-1])
+            users, total = await user_crud.get_multi_with_query(
+                self.db, query=UserQuery(limit=limit, cursor=cursor)
+            )
+            self.assertEqual(total, 7)
+            ids.extend(u.id for u in users)
+        return ids
+
+    def test_cursor_round_trip(self):
+        user = _user(1)
+        self.assertEqual(user_crud.decode_cursor(user_crud.encode_cursor(user)), (NOW, "local:01"))
+
+        user.created_at = None
+        self.assertEqual(user_crud.decode_cursor(user_crud.encode_cursor(user)), (None, "local:01"))
+
+    def test_malformed_cursor_raises_value_error(self):
+        for cursor in ("not base64!", "bm8tc2VwYXJhdG9y"):
+            with self.subTest(cursor=cursor), self.assertRaises(ValueError):
+                user_crud.decode_cursor(cursor)
+
+    async def test_keyset_pages_match_offset_order(self):
+        users, total = await user_crud.get_multi_with_query(self.db, query=UserQuery(limit=100))
+        self.assertEqual(total, 7)
+        expected = [u.id for u in users]
+        # created_at이 없는 행이 먼저, 나머지는 (created_at, id) 내림차순
+        self.assertEqual(expected[:2], ["local:05", "local:03"])
+        self.assertEqual(expected[2:], ["local:04", "local:06", "local:01", "local:00", "local:02"])
+
+        for limit in (1, 2, 3):
+            with self.subTest(limit=limit):
+                self.assertEqual(await self._walk(limit), expected)
+
+
+class TestGetPage(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = make_session(User.__table__)
+        self.db.add_all(_user(n) for n in range(5))
+        await self.db.commit()
+
+    async def test_total_comes_from_window_count(self):
+        users, total = await user_crud.get_page(
+            self.db, order_by=(User.id.asc(),), offset=1, limit=2
+        )
+        self.assertEqual([u.id for u in users], ["local:01", "local:02"])
+        self.assertEqual(total, 5)
+
+    async def test_filtered_page(self):
+        users, total = await user_crud.get_page(
+            self.db, where_clause=User.id >= "local:03", order_by=User.id.desc()
+        )
+        self.assertEqual([u.id for u in users], ["local:04", "local:03"])
+        self.assertEqual(total, 2)
+
+    async def test_empty_page_falls_back_to_count(self):
+        self.assertEqual(await user_crud.get_page(self.db, offset=10, limit=2), ([], 5))
+        self.assertEqual(await user_crud.get_page(self.db, limit=0), ([], 5))
+
+    async def test_no_match(self):
+        self.assertEqual(await user_crud.get_page(self.db, where_clause=User.id == "x"), ([], 0))
+
+
+class TestUpdateById(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = make_session(User.__table__)
+        self.db.add(_user(1))
+        await self.db.commit()
+
+    async def test_returns_updated_row(self):
+        updated = await user_crud.update_by_id(self.db, id="local:01", values={"is_active": False})
+        self.assertIsNotNone(updated)
+        self.assertFalse(updated.is_active)
+
+    async def test_missing_row_returns_none(self):
+        self.assertIsNone(
+            await user_crud.update_by_id(self.db, id="local:99", values={"is_active": False})
+        )
+
+    async def test_pending_changes_are_kept(self):
+        loaded = await self.db.get(User, "local:01")
+        loaded.name = "renamed"
+
+        updated = await user_crud.update_by_id(self.db, id="local:01", values={"phone": "010"})
+
+        self.assertIs(updated, loaded)
+        self.assertEqual(updated.name, "renamed")
+        self.assertEqual(updated.phone, "010")
+
+
+class TestCachedUser(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = make_session(User.__table__)
+        self.db.add(_user(1))
+        await self.db.commit()
+        self.addCleanup(user_crud._user_cache.clear)
+
+    async def test_snapshot_recached_before_commit_is_dropped(self):
+        await user_crud.get_cached(self.db, "local:01")
+        await user_crud.update_by_id(self.db, id="local:01", values={"is_active": False})
+        # 커밋 전 다른 요청이 이전 값을 다시 캐시한 상황
+        user_crud._user_cache["local:01"] = (float("inf"), {"id": "local:01"})
+
+        await self.db.commit()
+
+        self.assertNotIn("local:01", user_crud._user_cache)
+        cached = await user_crud.get_cached(self.db, "local:01")
+        self.assertFalse(cached.is_active)
+
+    async def test_count_cache_cleared_on_commit(self):
+        self.addCleanup(user_crud.clear_cache)
+        user = await self.db.get(User, "local:01")
+        await user_crud.deactivate(self.db, db_obj=user)
+        # 커밋 전 목록 요청이 이전 합계를 캐시한 상황
+        user_crud._count_cache[("stale",)] = (float("inf"), 5000)
+
+        await self.db.commit()
+
+        self.assertEqual(user_crud._count_cache, {})
+
+
+class TestToggleLike(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.enterContext(allow_naive_datetimes())
+        self.db = make_session(DiscussionLike.__table__)
+
+    async def test_second_toggle_hits_conflict_and_unlikes(self):
+        liked = await discussion_like.toggle_like(self.db, user_id="local:01", discussion_id=1)
+        self.assertTrue(liked)
+        self.assertTrue(await discussion_like.is_liked(self.db, user_id="local:01", discussion_id=1))
+
+        liked = await discussion_like.toggle_like(self.db, user_id="local:01", discussion_id=1)
+        self.assertFalse(liked)
+        self.assertFalse(await discussion_like.is_liked(self.db, user_id="local:01", discussion_id=1))
+
+    async def test_reply_like_is_separate_from_discussion_like(self):
+        self.assertTrue(await discussion_like.toggle_like(self.db, user_id="local:01", discussion_id=1))
+        self.assertTrue(await discussion_like.toggle_like(self.db, user_id="local:01", reply_id=1))
+        self.assertTrue(await discussion_like.is_liked(self.db, user_id="local:01", reply_id=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""실거래가 keyset 페이지네이션 커서 왕복 테스트."""
+
+import unittest
+from datetime import date
+
+from app.crud import public_data
+from app.models.enums import PropertyType
+from app.models.transaction import RealEstateSale
+from tests.sqlite_session import NOW, make_session
+
+SGG = "11680"
+
+
+class TestSalesKeysetPagination(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.db = make_session(RealEstateSale.__table__)
+        dates = [None, date(2024, 3, 1), None, date(2024, 1, 5), date(2024, 3, 1), None, date(2023, 12, 31)]
+        self.db.add_all(
+            RealEstateSale(
+                property_type=PropertyType.APARTMENT,
+                sgg_code=SGG,
+                transaction_date=d,
+                created_at=NOW,
+                updated_at=NOW,
+            )
+            for d in dates
+        )
+        # 다른 시군구 행은 결과에 섞이지 않아야 함
+        self.db.add(
+            RealEstateSale(
+                property_type=PropertyType.APARTMENT,
+                sgg_code="11110",
+                transaction_date=date(2024, 2, 1),
+                created_at=NOW,
+                updated_at=NOW,
+            )
+        )
+        await self.db.commit()
+
+    async def _walk(self, limit: int) -> list[RealEstateSale]:
+        rows, cursor = [], None
+        while True:
+            page, cursor = await public_data.get_sales(self.db, SGG, cursor=cursor, limit=limit)
+            rows.extend(page)
+            if cursor is None:
+                return rows
+
+    async def test_cursor_round_trip_keeps_undated_rows(self):
+        everything, last = await public_data.get_sales(self.db, SGG, limit=100)
+        self.assertIsNone(last)
+        self.assertEqual(len(everything), 7)
+
+        for limit in (1, 2, 3, 4):
+            with self.subTest(limit=limit):
+                rows = await self._walk(limit)
+                self.assertEqual([r.id for r in rows], [r.id for r in everything])
+
+    async def test_order_is_date_desc_nulls_first_then_id_desc(self):
+        rows = await self._walk(2)
+        keys = [(r.transaction_date, r.id) for r in rows]
+
+        undated = [k for k in keys if k[0] is None]
+        self.assertEqual(keys[: len(undated)], undated)
+        self.assertEqual(undated, sorted(undated, key=lambda k: k[1], reverse=True))
+        dated = keys[len(undated):]
+        self.assertEqual(dated, sorted(dated, reverse=True))
+
+    async def test_cursor_inside_null_segment(self):
+        first, cursor = await public_data.get_sales(self.db, SGG, limit=2)
+        self.assertIsNone(cursor[0])
+        rest, _ = await public_data.get_sales(self.db, SGG, cursor=cursor, limit=100)
+        self.assertEqual(len(first) + len(rest), 7)
+        self.assertIsNone(rest[0].transaction_date)
+        self.assertIsNotNone(rest[1].transaction_date)
+
+
+if __name__ == "__main__":
+    unittest.main()
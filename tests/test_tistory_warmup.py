@@ -0,0 +1,73 @@
+"""티스토리 로그인 사전 준비(warm-up) 테스트."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.core.agent.supervisor import SupervisorAgent
+
+
+class TestTistoryWarmup(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # LLM/그래프 초기화 없이 발행 관련 헬퍼만 검증
+        self.agent = SupervisorAgent.__new__(SupervisorAgent)
+        self.agent._writer_future = None
+
+        self.settings = MagicMock(
+            tistory_auto_publish=True, tistory_id="id", tistory_password="pw"
+        )
+        self.enterContext(patch("app.core.agent.supervisor.settings", self.settings))
+        self.writer_cls = self.enterContext(
+            patch("app.core.agent.tools.tistory_publisher.TistoryWriter")
+        )
+        self.writer = self.writer_cls.return_value
+
+    def _state(self):
+        content = MagicMock(blog_title="제목", image_paths=[])
+        return {"final_content": content, "steps_log": []}
+
+    async def test_warmup_disabled_without_setting(self):
+        self.settings.tistory_auto_publish = False
+        self.assertFalse(self.agent._can_publish())
+
+        self.agent._start_writer_warmup()
+
+        self.assertIsNone(self.agent._writer_future)
+        self.writer_cls.assert_not_called()
+
+    async def test_publish_reuses_warmed_up_writer(self):
+        self.agent._start_writer_warmup()
+        self.assertIsNotNone(self.agent._writer_future)
+
+        result = await self.agent._publish_content_node(self._state())
+
+        self.writer_cls.assert_called_once_with("id", "pw")
+        self.writer.login.assert_called_once()
+        self.writer.write_post.assert_called_once()
+        self.writer.close.assert_called_once()
+        self.assertTrue(result["post_url"])
+        self.assertIsNone(self.agent._writer_future)
+
+    async def test_unused_writer_is_closed(self):
+        self.agent._start_writer_warmup()
+
+        await self.agent._close_pending_writer()
+
+        self.writer.login.assert_called_once()
+        self.writer.close.assert_called_once()
+        self.writer.write_post.assert_not_called()
+        self.assertIsNone(self.agent._writer_future)
+
+    async def test_failed_login_records_empty_post_url(self):
+        self.writer.login.side_effect = RuntimeError("login failed")
+
+        result = await self.agent._publish_content_node(self._state())
+
+        # 빈 문자열이면 라우터가 발행을 다시 시도하지 않음
+        self.assertEqual(result["post_url"], "")
+        self.assertIn("login failed", result["error"])
+        self.writer.close.assert_called_once()
+        self.writer.write_post.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()